@@ -2,10 +2,39 @@ from __future__ import annotations
 
 from datetime import timezone
 import html
-import math
 
 from src.automations_lib.models import AutomationContext, AutomationResult
 from src.automations_lib.providers.finance_provider import FinanceProvider, QuoteValue
+from src.automations_lib.singleflight import SingleFlight
+
+
+# Swap the en-US separators for pt-BR in one pass: 1,234.56 -> 1.234,56.
+_BR_NUMBER_TRANS = str.maketrans({",": ".", ".": ","})
+
+
+def _format_number_br(value: float, decimals: int, truncate: bool = False) -> str:
+    if truncate:
+        factor = 10 ** decimals
+        value = int(value * factor) / factor
+    return f"{value:,.{decimals}f}".translate(_BR_NUMBER_TRANS)
+
+
+def _format_number_plain(value: float, decimals: int, truncate: bool = False) -> str:
+    if truncate:
+        factor = 10 ** decimals
+        value = int(value * factor) / factor
+    return f"{value:.{decimals}f}"
+
+
+def _format_signed_pct(value: float) -> str:
+    return f"{value:+.2f}%"
+
+
+# Labels are constants, so escape them once at import instead of on every run.
+_BTC_LABEL = html.escape("Bitcoin (BTC/BRL)")
+_USD_LABEL = html.escape("Dolar (USD/BRL)")
+_EUR_LABEL = html.escape("Euro (EUR/BRL)")
+_IBOV_LABEL = html.escape("B3 (IBOV)")
 
 
 class StatusFinanceAutomation:
@@ -14,18 +43,22 @@ class StatusFinanceAutomation:
 
     def __init__(self, provider: FinanceProvider) -> None:
         self._provider = provider
+        self._single_flight: SingleFlight[AutomationResult] = SingleFlight()
 
     async def run(self, context: AutomationContext) -> AutomationResult:
+        return await self._single_flight.run(self.name, lambda: self._run(context))
+
+    async def _run(self, context: AutomationContext) -> AutomationResult:
         snapshot = await self._provider.fetch_snapshot(
             awesome_url=context.settings.finance_awesomeapi_url,
             yahoo_b3_url=context.settings.finance_yahoo_b3_url,
         )
         lines = [
             "<b>Cotacoes Financeiras</b>",
-            self._format_currency_line("Bitcoin (BTC/BRL)", snapshot.bitcoin),
-            self._format_currency_line("Dolar (USD/BRL)", snapshot.usd),
-            self._format_currency_line("Euro (EUR/BRL)", snapshot.eur),
-            self._format_ibov_line("B3 (IBOV)", snapshot.ibov),
+            self._format_currency_line(_BTC_LABEL, snapshot.bitcoin, is_btc=True),
+            self._format_currency_line(_USD_LABEL, snapshot.usd),
+            self._format_currency_line(_EUR_LABEL, snapshot.eur),
+            self._format_ibov_line(_IBOV_LABEL, snapshot.ibov),
         ]
         return AutomationResult(
             title="Finance",
@@ -36,43 +69,24 @@ class StatusFinanceAutomation:
         )
 
     @staticmethod
-    def _format_currency_line(label: str, quote: QuoteValue | None) -> str:
-        safe_label = html.escape(label)
+    def _format_currency_line(
+        safe_label: str,
+        quote: QuoteValue | None,
+        is_btc: bool = False,
+    ) -> str:
         if quote is None:
             return f"{safe_label}: indisponivel no momento"
-        if "BTC/BRL" in label:
-            price = StatusFinanceAutomation._format_number_br(quote.price, decimals=2)
+        if is_btc:
+            price = _format_number_br(quote.price, decimals=2)
         else:
-            price = StatusFinanceAutomation._format_number_plain(
-                quote.price, decimals=2, truncate=True
-            )
-        change = StatusFinanceAutomation._format_signed_pct(quote.change_pct)
+            price = _format_number_plain(quote.price, decimals=2, truncate=True)
+        change = _format_signed_pct(quote.change_pct)
         return f"{safe_label}: R$ {price} | var: {change}"
 
     @staticmethod
-    def _format_ibov_line(label: str, quote: QuoteValue | None) -> str:
-        safe_label = html.escape(label)
+    def _format_ibov_line(safe_label: str, quote: QuoteValue | None) -> str:
         if quote is None:
             return f"{safe_label}: indisponivel no momento"
-        price = StatusFinanceAutomation._format_number_br(quote.price, decimals=2)
-        change = StatusFinanceAutomation._format_signed_pct(quote.change_pct)
+        price = _format_number_br(quote.price, decimals=2)
+        change = _format_signed_pct(quote.change_pct)
         return f"{safe_label}: {price} pts | var: {change}"
-
-    @staticmethod
-    def _format_number_br(value: float, decimals: int, truncate: bool = False) -> str:
-        if truncate:
-            factor = 10 ** decimals
-            value = math.trunc(value * factor) / factor
-        formatted = f"{value:,.{decimals}f}"
-        return formatted.replace(",", "_").replace(".", ",").replace("_", ".")
-
-    @staticmethod
-    def _format_number_plain(value: float, decimals: int, truncate: bool = False) -> str:
-        if truncate:
-            factor = 10 ** decimals
-            value = math.trunc(value * factor) / factor
-        return f"{value:.{decimals}f}"
-
-    @staticmethod
-    def _format_signed_pct(value: float) -> str:
-        return f"{value:+.2f}%"
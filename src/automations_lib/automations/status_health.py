@@ -1,82 +1,157 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import timezone
 import html
+from functools import lru_cache
+from time import monotonic
 
 from src.automations_lib.models import AutomationContext, AutomationResult
-from src.automations_lib.providers.health_provider import HealthProvider
+from src.automations_lib.providers.health_provider import HealthProbe, HealthProvider
+from src.automations_lib.providers.host_status_provider import (
+    meta_whatsapp_metric_url,
+    meta_whatsapp_outages_url,
+)
 from src.automations_lib.providers.weather_provider import WeatherProvider
 
 
+@lru_cache(maxsize=4)
+def _build_probes(
+    *,
+    trends_primary_url: str,
+    trends_fallback_url: str,
+    finance_awesomeapi_url: str,
+    finance_yahoo_b3_url: str,
+    locaweb_components_url: str,
+    locaweb_incidents_url: str,
+    meta_orgs_url: str,
+    meta_outages_url_template: str,
+    meta_metrics_url_template: str,
+    umbrella_summary_url: str,
+    umbrella_incidents_url: str,
+    hostinger_summary_url: str,
+) -> tuple[tuple[str, str], ...]:
+    return (
+        ("Noticias:G1", "https://g1.globo.com/rss/g1/"),
+        ("Noticias:TecMundo", "https://rss.tecmundo.com.br/feed"),
+        ("Noticias:BoletimSec", "https://boletimsec.com/feed/"),
+        ("Clima:Geocoding", WeatherProvider.GEOCODE_URL),
+        ("Clima:Forecast", WeatherProvider.FORECAST_URL),
+        ("Trends:Primario", trends_primary_url),
+        ("Trends:Fallback", trends_fallback_url),
+        ("Finance:AwesomeAPI", finance_awesomeapi_url),
+        ("Finance:YahooB3", finance_yahoo_b3_url),
+        ("Locaweb:Components", locaweb_components_url),
+        ("Locaweb:Incidents", locaweb_incidents_url),
+        ("Meta:Orgs", meta_orgs_url),
+        (
+            "Meta:Outages",
+            meta_whatsapp_outages_url(meta_outages_url_template),
+        ),
+        (
+            "Meta:Metrics",
+            meta_whatsapp_metric_url(
+                meta_metrics_url_template, "cloudapi_uptime_daily"
+            ),
+        ),
+        ("Umbrella:Summary", umbrella_summary_url),
+        ("Umbrella:Incidents", umbrella_incidents_url),
+        ("Hostinger:Summary", hostinger_summary_url),
+    )
+
+
 class StatusHealthAutomation:
     name = "status_health"
     trigger = "health"
 
-    def __init__(self, provider: HealthProvider) -> None:
+    def __init__(self, provider: HealthProvider, cache_ttl_seconds: float = 10.0) -> None:
         self._provider = provider
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._cache: tuple[float, tuple[tuple[str, str], ...], list[HealthProbe]] | None = None
+        self._cache_lock = asyncio.Lock()
 
     async def run(self, context: AutomationContext) -> AutomationResult:
         settings = context.settings
-        probes = [
-            ("Noticias:G1", "https://g1.globo.com/rss/g1/"),
-            ("Noticias:TecMundo", "https://rss.tecmundo.com.br/feed"),
-            ("Noticias:BoletimSec", "https://boletimsec.com/feed/"),
-            ("Clima:Geocoding", WeatherProvider.GEOCODE_URL),
-            ("Clima:Forecast", WeatherProvider.FORECAST_URL),
-            ("Trends:Primario", settings.trends_primary_url),
-            ("Trends:Fallback", settings.trends_fallback_url),
-            ("Finance:AwesomeAPI", settings.finance_awesomeapi_url),
-            ("Finance:YahooB3", settings.finance_yahoo_b3_url),
-            ("Locaweb:Components", settings.locaweb_components_url),
-            ("Locaweb:Incidents", settings.locaweb_incidents_url),
-            ("Meta:Orgs", settings.meta_orgs_url),
-            (
-                "Meta:Outages",
-                settings.meta_outages_url_template.format(org="whatsapp-business-api"),
-            ),
-            (
-                "Meta:Metrics",
-                settings.meta_metrics_url_template.format(
-                    org="whatsapp-business-api",
-                    metric="cloudapi_uptime_daily",
-                ),
-            ),
-            ("Umbrella:Summary", settings.umbrella_summary_url),
-            ("Umbrella:Incidents", settings.umbrella_incidents_url),
-            ("Hostinger:Summary", settings.hostinger_summary_url),
-        ]
-        results = await self._provider.fetch_health(probes)
-        ok_count = sum(1 for item in results if item.ok)
-        total = len(results)
+        probes = _build_probes(
+            trends_primary_url=settings.trends_primary_url,
+            trends_fallback_url=settings.trends_fallback_url,
+            finance_awesomeapi_url=settings.finance_awesomeapi_url,
+            finance_yahoo_b3_url=settings.finance_yahoo_b3_url,
+            locaweb_components_url=settings.locaweb_components_url,
+            locaweb_incidents_url=settings.locaweb_incidents_url,
+            meta_orgs_url=settings.meta_orgs_url,
+            meta_outages_url_template=settings.meta_outages_url_template,
+            meta_metrics_url_template=settings.meta_metrics_url_template,
+            umbrella_summary_url=settings.umbrella_summary_url,
+            umbrella_incidents_url=settings.umbrella_incidents_url,
+            hostinger_summary_url=settings.hostinger_summary_url,
+        )
+        results = await self._fetch_health_cached(probes)
+        h = html.escape
+        ok_count = 0
+        status_lines: list[str] = []
+        failure_lines: list[str] = []
+        # One pass: each source is escaped once and feeds both sections.
+        for item in results:
+            safe_source = h(item.source)
+            latency = f"{item.latency_ms}ms" if item.latency_ms is not None else "n/a"
+            status_code = str(item.status_code) if item.status_code is not None else "-"
+            if item.ok:
+                ok_count += 1
+                status = "OK"
+            else:
+                status = "FALHA"
+                failure_lines.append(
+                    f"- {safe_source}: {h(item.error or 'erro desconhecido')}"
+                )
+            status_lines.append(
+                f"- {safe_source}: {status} | latency {latency} | status {status_code}"
+            )
         lines = [
             "<b>Health Check</b>",
-            f"Trace: <code>{html.escape(context.trace_id)}</code>",
-            f"Fontes OK: <b>{ok_count}/{total}</b>",
+            f"Trace: <code>{h(context.trace_id)}</code>",
+            f"Fontes OK: <b>{ok_count}/{len(results)}</b>",
+            *status_lines,
         ]
-        failed = [item for item in results if not item.ok]
-        for item in results:
-            status = "OK" if item.ok else "FALHA"
-            latency = (
-                f"{item.latency_ms}ms" if item.latency_ms is not None else "n/a"
-            )
-            status_code = (
-                str(item.status_code) if item.status_code is not None else "-"
-            )
-            lines.append(
-                f"- {html.escape(item.source)}: {status} | latency {latency} | status {status_code}"
-            )
-        if failed:
+        if failure_lines:
             lines.append("<b>Falhas por fonte</b>")
-            for item in failed:
-                lines.append(
-                    f"- {html.escape(item.source)}: {html.escape(item.error or 'erro desconhecido')}"
-                )
+            lines.extend(failure_lines)
         return AutomationResult(
             title="Health",
             message="\n".join(lines),
             source_label="Internal Provider Health",
             generated_at=context.utc_now().astimezone(timezone.utc),
-            ok=len(failed) == 0,
-            severity="info" if not failed else "alerta",
+            ok=not failure_lines,
+            severity="info" if not failure_lines else "alerta",
         )
 
+    async def _fetch_health_cached(
+        self, probes: tuple[tuple[str, str], ...]
+    ) -> list[HealthProbe]:
+        key = probes
+        cached = self._fresh_cache(key)
+        if cached is not None:
+            return cached
+        # Single-flight: concurrent /health calls wait for the same probe round.
+        async with self._cache_lock:
+            cached = self._fresh_cache(key)
+            if cached is not None:
+                return cached
+            try:
+                results = await self._provider.fetch_health(probes)
+            except Exception:
+                if self._cache is not None and self._cache[1] == key:
+                    return self._cache[2]
+                raise
+            self._cache = (monotonic(), key, results)
+            return results
+
+    def _fresh_cache(
+        self, key: tuple[tuple[str, str], ...]
+    ) -> list[HealthProbe] | None:
+        if self._cache is None:
+            return None
+        stored_at, cached_key, results = self._cache
+        if cached_key != key or monotonic() - stored_at >= self._cache_ttl_seconds:
+            return None
+        return results
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta, timezone
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 import html
 import re
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from zoneinfo import ZoneInfo
 
 import httpx
 
@@ -14,6 +18,7 @@ from src.automations_lib.providers.host_status_provider import (
     HostIncident,
     HostIncidentUpdate,
     HostMaintenance,
+    HostSnapshot,
     HostStatusProvider,
     LocawebReport,
     MetaOrgReport,
@@ -21,21 +26,179 @@ from src.automations_lib.providers.host_status_provider import (
     UmbrellaReport,
     WebsiteChecksReport,
 )
+from src.automations_lib.providers.http_pool import HttpClientPool
+from src.automations_lib.bounded_cache import BoundedCache
+from src.automations_lib.singleflight import SingleFlight
+from src.automations_lib.timezones import resolve_timezone
+from src.config import Settings
+
+
+def _format_local(local: datetime) -> str:
+    # Fixed "%d/%m/%Y %H:%M" layout built directly; strftime re-parses its format.
+    return (
+        f"{local.day:02d}/{local.month:02d}/{local.year:04d} "
+        f"{local.hour:02d}:{local.minute:02d}"
+    )
+
+
+@lru_cache(maxsize=8)
+def _datetime_formatter(
+    tzinfo: timezone | ZoneInfo,
+) -> Callable[[datetime | None], str]:
+    # Fixed-offset zones have no DST, so shifting by the offset difference is
+    # enough and skips astimezone(); ZoneInfo keeps the full conversion.
+    fixed_offset = tzinfo.utcoffset(None) if isinstance(tzinfo, timezone) else None
+
+    def format_datetime(dt: datetime | None) -> str:
+        if dt is None:
+            return "horario indisponivel"
+        if dt.tzinfo is tzinfo:
+            return _format_local(dt)
+        source_offset = dt.utcoffset()
+        if fixed_offset is not None and source_offset is not None:
+            return _format_local(dt + (fixed_offset - source_offset))
+        return _format_local(dt.astimezone(tzinfo))
+
+    return format_datetime
+
+
+# Sorts undated maintenance windows last.
+_DT_SENTINEL = datetime.max.replace(tzinfo=timezone.utc)
+
+_OPERATIONAL_STATUSES = frozenset({"operational"})
+# "Normal" is the provider's human label for operational; list it as-is so the
+# fast path hits without lowercasing.
+_NORMAL_STATUSES = frozenset({"normal", "Normal"})
+
+
+# Fast path: statuses usually arrive already canonical, so only lowercase on miss.
+def _is_operational(status: str) -> bool:
+    return status in _OPERATIONAL_STATUSES or status.lower() in _OPERATIONAL_STATUSES
+
+
+def _is_normal(status: str) -> bool:
+    return status in _NORMAL_STATUSES or status.lower() in _NORMAL_STATUSES
+
+
+# Incidents and their updates repeat the same timestamps across sections; aware
+# datetimes hash by instant, so equal instants share one rendered string.
+@lru_cache(maxsize=256)
+def _format_datetime(dt: datetime | None, tzinfo: timezone | ZoneInfo) -> str:
+    return _datetime_formatter(tzinfo)(dt)
+
+
+def _format_meta_org(org: MetaOrgReport) -> str:
+    h = html.escape
+    state = "OK" if org.all_no_known_issues else "ALERTA"
+    statuses = ", ".join(h(status) for status in org.statuses) if org.statuses else "unknown"
+    return f"- {h(org.display_name)}: {state} ({statuses})"
+
+
+# Same boundaries as str.splitlines(); each match is one non-empty line, already stripped.
+_LINE_BREAKS = "\r\n\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+_NON_EMPTY_LINE = re.compile(rf"\S(?:[^{_LINE_BREAKS}]*\S)?")
+
+
+def _truncate_lines(text: str, max_lines: int) -> list[str]:
+    # Stop scanning once we know the body overflows; long bodies are not split fully.
+    lines = [match.group() for match in islice(_NON_EMPTY_LINE.finditer(text), max_lines + 1)]
+    if not lines:
+        return ["Sem detalhes."]
+    if len(lines) <= max_lines:
+        return lines
+    return lines[: max_lines - 1] + [f"{lines[max_lines - 1]} ..."]
 
 
-def _resolve_timezone(timezone_name: str) -> timezone | ZoneInfo:
+def _truncate_chars(text: str, max_chars: int) -> str:
+    # Collect lines only until the joined length passes the cap.
+    parts: list[str] = []
+    length = -1
+    for match in _NON_EMPTY_LINE.finditer(text):
+        parts.append(match.group())
+        length += len(parts[-1]) + 1
+        if length > max_chars:
+            break
+    compact = " ".join(parts)
+    if len(compact) <= max_chars:
+        return compact
+    return compact[:max_chars].rstrip()
+
+
+def _prepare_body(text: str, max_chars: int | None, max_lines: int) -> list[str]:
+    if max_chars is None:
+        return _truncate_lines(text, max_lines)
+    # A char-capped body is a single line already; no second scan needed.
+    compact = _truncate_chars(text, max_chars)
+    return [compact] if compact else ["Sem detalhes."]
+
+
+# Strings without a single letter (times, counters, punctuation) never need translating.
+_SKIP_TRANSLATE = re.compile(r"^[\W\d_]+$")
+
+
+@lru_cache(maxsize=1)
+def _shared_translator():
+    # One googletrans client (and its HTTP session) for every automation instance.
+    # There is no await between the check and the construction, so no lock is needed.
     try:
-        return ZoneInfo(timezone_name)
-    except ZoneInfoNotFoundError:
-        if timezone_name == "America/Sao_Paulo":
-            return timezone(timedelta(hours=-3))
-        return timezone.utc
+        from googletrans import Translator
+    except Exception:
+        return None
+    return Translator()
+
+
+def _with_capitalized_variants(
+    translations: dict[str, str], keys: Iterable[str]
+) -> dict[str, str]:
+    return {
+        variant: translations[key]
+        for key in keys
+        for variant in (key, key.capitalize())
+    }
+
+
+def _untranslated(text: str) -> str:
+    return text
+
+
+_BOLD_TAGS = ("<b>", "</b>")
+_ITALIC_TAGS = ("<i>", "</i>")
+
+
+def _wrap_title(safe_title: str, bold: bool) -> str:
+    open_tag, close_tag = _BOLD_TAGS if bold else _ITALIC_TAGS
+    return f"{open_tag}{safe_title}{close_tag}"
+
+
+def _join_sections(sections: Iterable[list[str]]) -> list[str]:
+    # Everything lands in one list that str.join consumes as-is; separators only
+    # go between non-empty sections, so the result needs no strip.
+    out: list[str] = []
+    for section in sections:
+        if not section:
+            continue
+        if out:
+            out.append("")
+        out.extend(section)
+    return out
 
 
 class StatusHostAutomation:
     name = "status_host"
     trigger = "host"
     _TRANSLATION_PROTECTED_TERMS = {"cisco umbrella"}
+    # Fixed labels translate the same way every run; their cache survives resets.
+    _STATIC_LABELS = frozenset(
+        {
+            "Saude: ALERTA",
+            "Saude: indisponivel",
+            "Incidentes ativos/hoje",
+            "Status",
+            "Inicio",
+            "Unknown",
+            "Sem detalhes.",
+        }
+    )
     _PT_FALLBACK_EXACT = {
         "resolved": "Resolvido",
         "identified": "Identificado",
@@ -52,6 +215,28 @@ class StatusHostAutomation:
         "major outage": "Indisponibilidade critica",
         "major_outage": "Indisponibilidade critica",
     }
+    # Statuspage status vocabulary has fixed Portuguese forms; seeding them
+    # means the translator is never asked for them.
+    _STATIC_PT = _with_capitalized_variants(
+        _PT_FALLBACK_EXACT,
+        (
+            "resolved",
+            "identified",
+            "investigating",
+            "monitoring",
+            "degraded performance",
+            "degraded_performance",
+            "partial outage",
+            "partial_outage",
+            "major outage",
+            "major_outage",
+        ),
+    )
+    _STATIC_KEYS = _STATIC_LABELS | frozenset(_STATIC_PT)
+    # Only texts within this length range can be an exact status token.
+    _PT_FALLBACK_EXACT_LENGTHS = range(
+        min(map(len, _PT_FALLBACK_EXACT)), max(map(len, _PT_FALLBACK_EXACT)) + 1
+    )
     _PT_FALLBACK_REPLACEMENTS = (
         (
             "All policy files have now been processed and the queue is clear.",
@@ -106,15 +291,102 @@ class StatusHostAutomation:
             "Agradecemos a paciencia e a compreensao enquanto trabalhamos para restaurar o servico ideal.",
         ),
     )
+    # One case-insensitive scan instead of a re.sub pass per pair. Longest sources
+    # come first so full sentences win over the fragments they contain.
+    _PT_FALLBACK_MAP = {source.lower(): target for source, target in _PT_FALLBACK_REPLACEMENTS}
+    _PT_FALLBACK_RE = re.compile(
+        "|".join(re.escape(source) for source in sorted(_PT_FALLBACK_MAP, key=len, reverse=True)),
+        re.IGNORECASE,
+    )
+    _RE_PVE_NODE = re.compile(r"\bpve-node-?(\d+)\b", re.IGNORECASE)
+    _RE_SERVER_CODE = re.compile(r"\b([a-z]{2,3}-\d{2,6})\b", re.IGNORECASE)
+    _RE_SERVER_CODE_PARTS = re.compile(r"^([A-Z]{2,3})-(\d+)$")
+    _RE_MAINTENANCE_NOISE = re.compile(
+        r"\b(?:pve-node-?\d+|server|maintenance)\b", re.IGNORECASE
+    )
+    _RE_WS = re.compile(r"\s+")
+    _RE_UNTRANSLATED = re.compile(r"[^a-z0-9]+")
+    _UNTRANSLATED_HEAD_CHARS = 128
 
-    def __init__(self, provider: HostStatusProvider, translator=None) -> None:
+    def __init__(
+        self,
+        provider: HostStatusProvider,
+        translator=None,
+        translation_cache_size: int = 2048,
+        translation_ttl_seconds: float = 24 * 60 * 60,
+        http_pool: HttpClientPool | None = None,
+        translation_retry_seconds: float = 10 * 60,
+    ) -> None:
         self._provider = provider
         self._translator = translator
-        self._translation_cache: dict[str, str] = {}
+        self._http_pool = http_pool
+        # Incident titles and bodies repeat run after run; keep them across
+        # reports, bounded in size and refreshed daily.
+        # Keyed by (critical, text): the text's hash is cached on the str, so
+        # lookups never rebuild or rehash a composite key.
+        self._translation_cache: BoundedCache[tuple[bool, str], str] = BoundedCache(
+            maxsize=translation_cache_size,
+            ttl_seconds=translation_ttl_seconds,
+        )
+        self._retry_cache: BoundedCache[tuple[bool, str], str] = BoundedCache(
+            maxsize=translation_cache_size,
+            ttl_seconds=translation_retry_seconds,
+        )
+        self._static_translation_cache: dict[tuple[bool, str], str] = {
+            (critical, source): target
+            for source, target in self._STATIC_PT.items()
+            for critical in (False, True)
+        }
+        # Outputs already produced this run; feeding one back needs no translation.
+        self._translated_values: set[str] = set()
+        self._single_flight: SingleFlight[AutomationResult] = SingleFlight()
+        self._translation_flight: SingleFlight[str] = SingleFlight()
 
     async def run(self, context: AutomationContext) -> AutomationResult:
+        return await self._single_flight.run(self.name, lambda: self._run(context))
+
+    async def _run(self, context: AutomationContext) -> AutomationResult:
         settings = context.settings
-        snapshot = await self._provider.fetch_snapshot(
+        self._translated_values = set()
+        # The section labels are known up front: translate them while the
+        # provider fan-out is in flight. After the first run this is a no-op.
+        warmup = asyncio.ensure_future(self._prime_translations(self._STATIC_LABELS))
+        umbrella_task: asyncio.Future[list[str]] | None = None
+        try:
+            snapshot = await self._fetch_snapshot(settings)
+            tzinfo = resolve_timezone(settings.host_report_timezone)
+            # Umbrella is the only section that waits on the network (translation).
+            # Let it reach its first request, then render the synchronous sections
+            # while that request is in flight.
+            umbrella_task = asyncio.ensure_future(
+                self._format_umbrella(snapshot.umbrella, tzinfo)
+            )
+            await asyncio.sleep(0)
+            sections = (
+                ["<b>Host Monitoring</b>"],
+                self._format_websites(snapshot.websites),
+                self._format_locaweb(snapshot.locaweb, tzinfo),
+                self._format_meta(snapshot.meta, tzinfo),
+                self._format_hostinger(snapshot.hostinger, tzinfo),
+                await umbrella_task,
+            )
+        finally:
+            # Umbrella primes the labels it uses itself, so the report never
+            # waits on the warmup; label requests already started finish in the
+            # background through the translation single-flight.
+            warmup.cancel()
+            if umbrella_task is not None:
+                umbrella_task.cancel()
+        return AutomationResult(
+            title="Host",
+            message="\n".join(_join_sections(sections)),
+            source_label="Locaweb | Meta | Cisco Umbrella | Hostinger | Site Checks",
+            generated_at=context.utc_now().astimezone(timezone.utc),
+            ok=True,
+        )
+
+    async def _fetch_snapshot(self, settings: Settings) -> HostSnapshot:
+        return await self._provider.fetch_snapshot(
             locaweb_components_url=settings.locaweb_components_url,
             locaweb_incidents_url=settings.locaweb_incidents_url,
             meta_orgs_url=settings.meta_orgs_url,
@@ -127,29 +399,6 @@ class StatusHostAutomation:
             hostinger_incidents_url=settings.hostinger_incidents_url,
             hostinger_status_page_url=settings.hostinger_status_page_url,
         )
-        self._translation_cache = {}
-        tzinfo = _resolve_timezone(settings.host_report_timezone)
-        lines = ["<b>Host Monitoring</b>"]
-        umbrella_section = await self._format_umbrella(snapshot.umbrella, tzinfo)
-        sections = [
-            self._format_websites(snapshot.websites),
-            self._format_locaweb(snapshot.locaweb, tzinfo),
-            self._format_meta(snapshot.meta, tzinfo),
-            self._format_hostinger(snapshot.hostinger, tzinfo),
-            umbrella_section,
-        ]
-        for section in sections:
-            if not section:
-                continue
-            lines.append("")
-            lines.extend(section)
-        return AutomationResult(
-            title="Host",
-            message="\n".join(lines).strip(),
-            source_label="Locaweb | Meta | Cisco Umbrella | Hostinger | Site Checks",
-            generated_at=context.utc_now().astimezone(timezone.utc),
-            ok=True,
-        )
 
     def _format_locaweb(
         self, report: LocawebReport, tzinfo: timezone | ZoneInfo
@@ -160,20 +409,16 @@ class StatusHostAutomation:
                 f"Falha ao consultar fonte: {html.escape(report.error)}"
             ]
 
-        lines: list[str] = []
-        for component, status in report.component_statuses.items():
-            if status.lower() == "operational":
-                continue
-            if not lines:
-                lines.append("<b>Locaweb</b>")
-                lines.append("Saude: ALERTA")
-            safe_component = html.escape(component)
-            safe_status = html.escape(status)
-            lines.append(f"- {safe_component}: {safe_status}")
-        if not lines:
+        h = html.escape
+        component_rows = [
+            f"- {h(component)}: {h(status)}"
+            for component, status in report.component_statuses.items()
+            if not _is_operational(status)
+        ]
+        if component_rows:
+            lines = ["<b>Locaweb</b>", "Saude: ALERTA", *component_rows]
+        else:
             lines = ["<b>Locaweb</b>", "Saude: OK"]
-        if report.incidents_today and not lines:
-            lines.append("<b>Locaweb</b>")
         lines.extend(
             self._format_incidents("Incidentes de hoje", report.incidents_today, tzinfo)
         )
@@ -188,8 +433,13 @@ class StatusHostAutomation:
             return lines
 
         lines.append("Saude: OK" if report.overall_ok else "Saude: ALERTA")
-        for component, status in report.vps_components_non_operational.items():
-            lines.append(f"- {html.escape(component)}: {html.escape(status)}")
+        h = html.escape
+        lines.extend(
+            [
+                f"- {h(component)}: {h(status)}"
+                for component, status in report.vps_components_non_operational.items()
+            ]
+        )
         lines.extend(
             self._format_incidents(
                 "Incidentes (hoje/ontem com impacto)",
@@ -210,14 +460,11 @@ class StatusHostAutomation:
         return lines
 
     def _format_websites(self, report: WebsiteChecksReport) -> list[str]:
+        h = html.escape
+        down_lines = [f"- {h(check.label)}: DOWN" for check in report.checks if not check.is_up]
         total = len(report.checks)
-        up_count = sum(1 for check in report.checks if check.is_up)
-        lines = ["<b>Sites Monitorados</b>", f"Sites OK: {up_count}/{total}"]
-        for check in report.checks:
-            if check.is_up:
-                continue
-            lines.append(f"- {html.escape(check.label)}: DOWN")
-        return lines
+        up_count = total - len(down_lines)
+        return ["<b>Sites Monitorados</b>", f"Sites OK: {up_count}/{total}", *down_lines]
 
     def _format_meta(self, report: MetaReport, tzinfo: timezone | ZoneInfo) -> list[str]:
         lines = ["<b>Meta</b>"]
@@ -229,11 +476,9 @@ class StatusHostAutomation:
 
         problem_org_lines: list[str] = []
         for org in report.orgs:
-            if org.statuses and all(
-                self._is_no_known_issue(status) for status in org.statuses
-            ):
+            if org.all_no_known_issues:
                 continue
-            problem_org_lines.append(self._format_meta_org(org))
+            problem_org_lines.append(_format_meta_org(org))
 
         lines.append("Saude: ALERTA" if problem_org_lines else "Saude: OK")
         if problem_org_lines:
@@ -267,6 +512,7 @@ class StatusHostAutomation:
     async def _format_umbrella(
         self, report: UmbrellaReport, tzinfo: timezone | ZoneInfo
     ) -> list[str]:
+        await self._prime_translations(self._umbrella_translation_texts(report))
         if report.error:
             title = await self._translate_text("Cisco Umbrella", critical=True)
             health = await self._translate_text("Saude: indisponivel", critical=True)
@@ -285,26 +531,39 @@ class StatusHostAutomation:
         if not has_alert:
             return []
 
+        h = html.escape
         title = await self._translate_text("Cisco Umbrella", critical=True)
         health = await self._translate_text("Saude: ALERTA", critical=True)
-        lines: list[str] = [f"<b>{html.escape(title)}</b>", html.escape(health)]
-        for component, human in report.component_statuses_human.items():
-            raw = report.component_statuses.get(component, "unknown")
-            if raw.lower() == "operational" and human.lower() == "normal":
-                continue
-            safe_component = html.escape(
-                await self._translate_text(component, critical=True)
+        lines: list[str] = [f"<b>{h(title)}</b>", h(health)]
+        raw_statuses = report.component_statuses
+        components = [
+            (component, human, raw)
+            for component, human in report.component_statuses_human.items()
+            if not (
+                _is_operational(raw := raw_statuses.get(component, "unknown"))
+                and _is_normal(human)
             )
-            safe_human = html.escape(await self._translate_text(human, critical=True))
-            safe_raw = html.escape(await self._translate_text(raw, critical=True))
-            lines.append(f"- {safe_component}: {safe_human} ({safe_raw})")
+        ]
+        # Translations were primed above, so each await is a cache hit.
+        translate = self._translate_text
         lines.extend(
-            await self._format_incidents_translated(
+            [
+                f"- {h(await translate(component, critical=True))}: "
+                f"{h(await translate(human, critical=True))} "
+                f"({h(await translate(raw, critical=True))})"
+                for component, human, raw in components
+            ]
+        )
+        # Umbrella shows only the latest update per incident.
+        lines.extend(
+            self._format_incidents(
                 await self._translate_text("Incidentes ativos/hoje", critical=True),
                 report.incidents_active_or_today,
                 tzinfo,
                 title_bold=True,
                 max_body_chars=170,
+                tr=self._primed_translation,
+                max_updates=1,
             )
         )
         return lines
@@ -339,7 +598,7 @@ class StatusHostAutomation:
             )
             if node_numbers:
                 formatted_nodes = " | ".join(
-                    f"({html.escape(number)})" for number in node_numbers
+                    f"({number})" for number in node_numbers
                 )
                 compact_rows.append((window[0], window[1], f"pve-node | {formatted_nodes}"))
 
@@ -352,12 +611,14 @@ class StatusHostAutomation:
 
         compact_rows.sort(
             key=lambda item: (
-                item[0] or datetime.max.replace(tzinfo=timezone.utc),
-                item[1] or datetime.max.replace(tzinfo=timezone.utc),
+                item[0] or _DT_SENTINEL,
+                item[1] or _DT_SENTINEL,
                 item[2].lower(),
             )
         )
 
+        # Dates and times come from our own fixed formats; only labels need escaping.
+        h = html.escape
         lines: list[str] = []
         current_header: tuple[str, str] | None = None
         for local_start, local_end, label in compact_rows:
@@ -366,20 +627,19 @@ class StatusHostAutomation:
             header = (start_date, end_date)
             if header != current_header:
                 lines.append(
-                    f"Server maintenance | inicio: {html.escape(start_date)} | "
-                    f"fim: {html.escape(end_date)}"
+                    f"Server maintenance | inicio: {start_date} | fim: {end_date}"
                 )
                 current_header = header
             start_time = self._format_time_only(local_start)
             end_time = self._format_time_only(local_end)
             lines.append(
-                f"{html.escape(start_time)} --- {html.escape(end_time)} | {html.escape(label)}"
+                f"{start_time} --- {end_time} | {h(label)}"
             )
         return lines
 
-    @staticmethod
-    def _extract_pve_node_number(name: str) -> str | None:
-        match = re.search(r"\bpve-node-?(\d+)\b", name, flags=re.IGNORECASE)
+    @classmethod
+    def _extract_pve_node_number(cls, name: str) -> str | None:
+        match = cls._RE_PVE_NODE.search(name)
         if not match:
             return None
         return match.group(1)
@@ -390,16 +650,16 @@ class StatusHostAutomation:
             return (0, f"{int(value):010d}")
         return (1, value.lower())
 
-    @staticmethod
-    def _extract_server_code(name: str) -> str | None:
-        match = re.search(r"\b([a-z]{2,3}-\d{2,6})\b", name, flags=re.IGNORECASE)
+    @classmethod
+    def _extract_server_code(cls, name: str) -> str | None:
+        match = cls._RE_SERVER_CODE.search(name)
         if not match:
             return None
         return match.group(1).upper()
 
-    @staticmethod
-    def _server_code_sort_key(code: str) -> tuple[str, int]:
-        match = re.match(r"^([A-Z]{2,3})-(\d+)$", code)
+    @classmethod
+    def _server_code_sort_key(cls, code: str) -> tuple[str, int]:
+        match = cls._RE_SERVER_CODE_PARTS.match(code)
         if not match:
             return (code, 0)
         return (match.group(1), int(match.group(2)))
@@ -410,13 +670,11 @@ class StatusHostAutomation:
         return "server" in lowered and "maintenance" in lowered
 
     def _normalize_maintenance_compact_label(self, name: str) -> str:
-        cleaned = re.sub(r"\bpve-node-?\d+\b", "", name, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\bserver\b", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\bmaintenance\b", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip(" -")
+        cleaned = self._RE_MAINTENANCE_NOISE.sub("", name)
+        cleaned = self._RE_WS.sub(" ", cleaned).strip(" -")
         if not cleaned:
             return "Maintenance"
-        return self._truncate_chars(cleaned, max_chars=70)
+        return _truncate_chars(cleaned, max_chars=70)
 
     @staticmethod
     def _to_local_datetime(
@@ -430,19 +688,13 @@ class StatusHostAutomation:
     def _format_date_only(dt: datetime | None) -> str:
         if dt is None:
             return "data indisponivel"
-        return dt.strftime("%d/%m/%Y")
+        return f"{dt.day:02d}/{dt.month:02d}/{dt.year:04d}"
 
     @staticmethod
     def _format_time_only(dt: datetime | None) -> str:
         if dt is None:
             return "horario indisponivel"
-        return dt.strftime("%H:%M")
-
-    @staticmethod
-    def _format_meta_org(org: MetaOrgReport) -> str:
-        state = "OK" if org.all_no_known_issues else "ALERTA"
-        statuses = ", ".join(html.escape(status) for status in org.statuses) if org.statuses else "unknown"
-        return f"- {html.escape(org.display_name)}: {state} ({statuses})"
+        return f"{dt.hour:02d}:{dt.minute:02d}"
 
     def _format_incidents(
         self,
@@ -451,222 +703,261 @@ class StatusHostAutomation:
         tzinfo: timezone | ZoneInfo,
         title_bold: bool = False,
         max_body_chars: int | None = None,
-    ) -> list[str]:
+        tr: Callable[[str], str] = _untranslated,
+        max_updates: int | None = None,
+    ) -> Iterator[str]:
         if not incidents:
-            return []
+            return
 
-        wrapper_start = "<b>" if title_bold else "<i>"
-        wrapper_end = "</b>" if title_bold else "</i>"
-        lines = [f"{wrapper_start}{html.escape(title)}{wrapper_end}"]
+        h = html.escape
+        yield _wrap_title(h(title), title_bold)
+        # The field labels are the same for every incident: resolve them once.
+        labels = (h(tr("Status")), h(tr("Inicio")))
         for incident in incidents:
-            lines.extend(
-                self._format_single_incident(
-                    incident=incident,
-                    tzinfo=tzinfo,
-                    max_body_chars=max_body_chars,
-                )
+            yield from self._format_single_incident(
+                incident=incident,
+                tzinfo=tzinfo,
+                max_body_chars=max_body_chars,
+                tr=tr,
+                max_updates=max_updates,
+                labels=labels,
             )
-        return lines
 
     def _format_single_incident(
         self,
         incident: HostIncident,
         tzinfo: timezone | ZoneInfo,
         max_body_chars: int | None = None,
-    ) -> list[str]:
-        started = self._format_datetime(incident.started_at, tzinfo)
-        lines = [
-            f"- {html.escape(incident.title)}",
-            f"  Status: {html.escape(incident.status)}",
-            f"  Inicio: {html.escape(started)}",
-        ]
-        for update in incident.updates:
-            lines.extend(
-                self._format_incident_update(
-                    update=update,
-                    tzinfo=tzinfo,
-                    max_body_chars=max_body_chars,
-                )
+        tr: Callable[[str], str] = _untranslated,
+        max_updates: int | None = None,
+        labels: tuple[str, str] | None = None,
+    ) -> Iterator[str]:
+        h = html.escape
+        status_label, start_label = labels or (h(tr("Status")), h(tr("Inicio")))
+        started = _format_datetime(incident.started_at, tzinfo)
+        yield f"- {h(tr(incident.title))}"
+        yield f"  {status_label}: {h(tr(incident.status))}"
+        yield f"  {start_label}: {started}"
+        updates = incident.updates if max_updates is None else incident.updates[:max_updates]
+        for update in updates:
+            yield from self._format_incident_update(
+                update=update,
+                tzinfo=tzinfo,
+                max_body_chars=max_body_chars,
+                tr=tr,
             )
-        return lines
 
     def _format_incident_update(
         self,
         update: HostIncidentUpdate,
         tzinfo: timezone | ZoneInfo,
         max_body_chars: int | None = None,
-    ) -> list[str]:
-        raw_status = update.status if update.status else "Unknown"
-        status = html.escape(raw_status) or "Unknown"
-        display_at = self._format_datetime(update.display_at, tzinfo)
-        raw_body = update.body if update.body else "Sem detalhes."
-        if max_body_chars is not None:
-            raw_body = self._truncate_chars(raw_body, max_body_chars)
-        body_lines = self._truncate_lines(raw_body, max_lines=3)
-        body_lines = [f"    {html.escape(line)}" for line in body_lines]
-        return [f"  - {status} | {display_at}", *body_lines]
-
-    async def _format_incidents_translated(
-        self,
-        title: str,
-        incidents: list[HostIncident],
-        tzinfo: timezone | ZoneInfo,
-        title_bold: bool = False,
-        max_body_chars: int | None = None,
-    ) -> list[str]:
-        if not incidents:
-            return []
-        wrapper_start = "<b>" if title_bold else "<i>"
-        wrapper_end = "</b>" if title_bold else "</i>"
-        lines = [f"{wrapper_start}{html.escape(title)}{wrapper_end}"]
-        for incident in incidents:
-            lines.extend(
-                await self._format_single_incident_translated(
-                    incident=incident,
-                    tzinfo=tzinfo,
-                    max_body_chars=max_body_chars,
-                )
-            )
-        return lines
+        tr: Callable[[str], str] = _untranslated,
+    ) -> Iterator[str]:
+        h = html.escape
+        raw_status = tr(update.status if update.status else "Unknown")
+        status = h(raw_status) or "Unknown"
+        display_at = _format_datetime(update.display_at, tzinfo)
+        raw_body = tr(update.body if update.body else "Sem detalhes.")
+        yield f"  - {status} | {display_at}"
+        for line in _prepare_body(raw_body, max_body_chars, max_lines=3):
+            yield f"    {h(line)}"
+
+    def _primed_translation(self, text: str) -> str:
+        # Sync view of _translate_text(critical=True) once the cache is primed;
+        # every path there that skips the translator returns the stripped text.
+        normalized = text.strip()
+        if not normalized:
+            return text
+        cached = self._cached_translation((True, normalized))
+        return cached if cached is not None else normalized
 
-    async def _format_single_incident_translated(
-        self,
-        incident: HostIncident,
-        tzinfo: timezone | ZoneInfo,
-        max_body_chars: int | None = None,
-    ) -> list[str]:
-        started = self._format_datetime(incident.started_at, tzinfo)
-        title = await self._translate_text(incident.title, critical=True)
-        status = await self._translate_text(incident.status, critical=True)
-        status_label = await self._translate_text("Status", critical=True)
-        start_label = await self._translate_text("Inicio", critical=True)
-        lines = [
-            f"- {html.escape(title)}",
-            f"  {html.escape(status_label)}: {html.escape(status)}",
-            f"  {html.escape(start_label)}: {html.escape(started)}",
-        ]
-        for update in incident.updates[:1]:
-            lines.extend(
-                await self._format_incident_update_translated(
-                    update=update,
-                    tzinfo=tzinfo,
-                    max_body_chars=max_body_chars,
+    @staticmethod
+    def _umbrella_translation_texts(report: UmbrellaReport) -> Iterator[str]:
+        if report.error:
+            yield "Saude: indisponivel"
+            yield f"Falha ao consultar fonte: {report.error}"
+            return
+        if report.all_operational and not report.incidents_active_or_today:
+            return
+        yield from ("Cisco Umbrella", "Saude: ALERTA", "Incidentes ativos/hoje", "Status", "Inicio")
+        raw_statuses = report.component_statuses
+        for component, human in report.component_statuses_human.items():
+            raw = raw_statuses.get(component, "unknown")
+            if _is_operational(raw) and _is_normal(human):
+                continue
+            yield from (component, human, raw)
+        for incident in report.incidents_active_or_today:
+            yield incident.title
+            yield incident.status
+            for update in incident.updates[:1]:
+                yield update.status or "Unknown"
+                yield update.body or "Sem detalhes."
+
+    async def _prime_translations(self, texts: Iterable[str], critical: bool = True) -> None:
+        # Resolve every distinct string of a section concurrently so the
+        # formatters below only hit the cache instead of awaiting one by one.
+        missing = {
+            normalized
+            for text in texts
+            if (normalized := text.strip())
+            and self._cached_translation((critical, normalized)) is None
+        }
+        if not missing:
+            return
+        batched: list[str] = []
+        if self._translates_over_http(critical):
+            batched = [text for text in missing if self._wants_http_batch(text)]
+        prefetched: dict[str, str] = {}
+        if len(batched) > 1:
+            # A failed batch leaves every string to its own request.
+            prefetched = await self._translate_batch_via_google_http(batched) or {}
+        await asyncio.gather(
+            *(
+                self._translate_text(
+                    text, critical=critical, prefetched=prefetched.get(text)
                 )
+                for text in missing
             )
-        return lines
-
-    async def _format_incident_update_translated(
-        self,
-        update: HostIncidentUpdate,
-        tzinfo: timezone | ZoneInfo,
-        max_body_chars: int | None = None,
-    ) -> list[str]:
-        raw_status = update.status if update.status else "Unknown"
-        raw_status = await self._translate_text(raw_status, critical=True)
-        status = html.escape(raw_status) or "Unknown"
-        display_at = self._format_datetime(update.display_at, tzinfo)
-        raw_body = update.body if update.body else "Sem detalhes."
-        raw_body = await self._translate_text(raw_body, critical=True)
-        if max_body_chars is not None:
-            raw_body = self._truncate_chars(raw_body, max_body_chars)
-        body_lines = self._truncate_lines(raw_body, max_lines=3)
-        body_lines = [f"    {html.escape(line)}" for line in body_lines]
-        return [f"  - {status} | {display_at}", *body_lines]
-
-    @staticmethod
-    def _truncate_lines(text: str, max_lines: int) -> list[str]:
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        if not lines:
-            return ["Sem detalhes."]
-        if len(lines) <= max_lines:
-            return lines
-        return lines[: max_lines - 1] + [f"{lines[max_lines - 1]} ..."]
-
-    @staticmethod
-    def _truncate_chars(text: str, max_chars: int) -> str:
-        compact = " ".join(part.strip() for part in text.splitlines() if part.strip())
-        if len(compact) <= max_chars:
-            return compact
-        return compact[:max_chars].rstrip()
+        )
 
-    @staticmethod
-    def _is_no_known_issue(status: str) -> bool:
-        return status.strip().lower() == "no known issues"
+    def _wants_http_batch(self, normalized: str) -> bool:
+        # Mirrors the early returns of _translate_text; multi-line bodies stay
+        # out of the batch because the batch is split back on line breaks.
+        return (
+            "\n" not in normalized
+            and normalized.lower() not in self._TRANSLATION_PROTECTED_TERMS
+            and not _SKIP_TRANSLATE.match(normalized)
+            and normalized not in self._translated_values
+        )
 
-    async def _translate_text(self, text: str, critical: bool = False) -> str:
+    def _cache_for(
+        self, normalized: str
+    ) -> BoundedCache[tuple[bool, str], str] | dict[tuple[bool, str], str]:
+        if normalized in self._STATIC_KEYS:
+            return self._static_translation_cache
+        return self._translation_cache
+
+    def _cached_translation(self, cache_key: tuple[bool, str]) -> str | None:
+        cached = self._cache_for(cache_key[1]).get(cache_key)
+        if cached is None:
+            cached = self._retry_cache.get(cache_key)
+        return cached
+
+    async def _translate_text(
+        self, text: str, critical: bool = False, prefetched: str | None = None
+    ) -> str:
         normalized = text.strip()
         if not normalized:
             return text
         if normalized.lower() in self._TRANSLATION_PROTECTED_TERMS:
             return normalized
-        cache_key = f"{int(critical)}:{normalized}"
-        cached = self._translation_cache.get(cache_key)
+        if _SKIP_TRANSLATE.match(normalized):
+            return normalized
+        cache_key = (critical, normalized)
+        cached = self._cached_translation(cache_key)
         if cached is not None:
             return cached
+        if normalized in self._translated_values:
+            return normalized
+        # Concurrent misses for the same string share one translator/HTTP call.
+        return await self._translation_flight.run(
+            cache_key,
+            lambda: self._resolve_translation(text, normalized, critical, prefetched),
+        )
 
-        fallback_text = self._apply_pt_fallback(normalized)
+    async def _resolve_translation(
+        self, text: str, normalized: str, critical: bool, prefetched: str | None = None
+    ) -> str:
         translator = self._get_translator()
-        if translator is None:
-            resolved = text
+        translated: str | None = None
+        if translator is None or self._translates_over_http(critical):
             if critical:
-                resolved = await self._translate_text_via_google_http(normalized)
-                if self._looks_untranslated(normalized, resolved):
-                    resolved = fallback_text
-            self._translation_cache[cache_key] = resolved
-            return resolved
+                translated = prefetched
+                if translated is None:
+                    translated = await self._translate_text_via_google_http(normalized)
+        else:
+            translated = await self._translate_with(translator, normalized)
 
+        succeeded = translated is not None and not self._looks_untranslated(
+            normalized, translated
+        )
+        if succeeded:
+            resolved = translated
+        elif critical:
+            resolved = self._apply_pt_fallback(normalized)
+        else:
+            resolved = translated or text
+        self._remember_translation((critical, normalized), resolved, succeeded)
+        return resolved
+
+    @staticmethod
+    async def _translate_with(translator, normalized: str) -> str | None:
         try:
             translated = translator.translate(normalized, dest="pt")
             if asyncio.iscoroutine(translated):
                 translated = await translated
-            translated_text = (getattr(translated, "text", "") or "").strip() or text
         except Exception:
-            translated_text = text
-
-        if critical and self._looks_untranslated(normalized, translated_text):
-            if self._can_use_http_translation(translator):
-                translated_text = await self._translate_text_via_google_http(normalized)
-        if critical and self._looks_untranslated(normalized, translated_text):
-            translated_text = fallback_text
-
-        self._translation_cache[cache_key] = translated_text
-        return translated_text
+            return None
+        return (getattr(translated, "text", "") or "").strip() or None
+
+    def _remember_translation(
+        self, cache_key: tuple[bool, str], resolved: str, succeeded: bool
+    ) -> None:
+        if succeeded:
+            self._cache_for(cache_key[1])[cache_key] = resolved
+            self._translated_values.add(resolved.strip())
+        else:
+            # Failed or echoed translations are retried after a short while
+            # instead of being pinned for the whole cache lifetime (the static
+            # cache is never evicted at all).
+            self._retry_cache[cache_key] = resolved
+
+    def _translates_over_http(self, critical: bool) -> bool:
+        # googletrans wraps the same endpoint; critical strings go to it directly
+        # (and can be batched) instead of through googletrans first.
+        if not critical:
+            return False
+        translator = self._get_translator()
+        return translator is None or self._can_use_http_translation(translator)
 
     def _get_translator(self):
-        if self._translator is not None:
-            return self._translator
-        try:
-            from googletrans import Translator
-        except Exception:
-            return None
-        self._translator = Translator()
+        if self._translator is None:
+            self._translator = _shared_translator()
         return self._translator
 
     @classmethod
+    @lru_cache(maxsize=512)
     def _apply_pt_fallback(cls, text: str) -> str:
+        # Pure function of the text; status pages repost the same bodies often.
         normalized = text.strip()
         if not normalized:
             return text
-        exact = cls._PT_FALLBACK_EXACT.get(normalized.lower())
-        if exact is not None:
-            return exact
-
-        translated = normalized
-        for source, target in cls._PT_FALLBACK_REPLACEMENTS:
-            translated = re.sub(
-                re.escape(source),
-                target,
-                translated,
-                flags=re.IGNORECASE,
-            )
-
-        return translated
+        if len(normalized) in cls._PT_FALLBACK_EXACT_LENGTHS:
+            exact = cls._PT_FALLBACK_EXACT.get(normalized.lower())
+            if exact is not None:
+                return exact
+
+        replacements = cls._PT_FALLBACK_MAP
+        return cls._PT_FALLBACK_RE.sub(
+            lambda match: replacements[match.group().lower()], normalized
+        )
 
-    @staticmethod
-    def _looks_untranslated(original: str, translated: str) -> bool:
+    @classmethod
+    def _looks_untranslated(cls, original: str, translated: str) -> bool:
         def normalize(value: str) -> str:
-            return re.sub(r"[^a-z0-9]+", "", value.lower())
-
+            return cls._RE_UNTRANSLATED.sub("", value.lower())
+
+        # Real translations differ within the first words: compare normalized
+        # heads before normalizing whole bodies. When the full forms are equal
+        # both heads are prefixes of the same string.
+        head = cls._UNTRANSLATED_HEAD_CHARS
+        if len(original) > head or len(translated) > head:
+            original_head = normalize(original[:head])
+            translated_head = normalize(translated[:head])
+            common = min(len(original_head), len(translated_head))
+            if original_head[:common] != translated_head[:common]:
+                return False
         return normalize(original) == normalize(translated)
 
     @staticmethod
@@ -674,9 +965,16 @@ class StatusHostAutomation:
         module_name = getattr(translator.__class__, "__module__", "")
         return module_name.startswith("googletrans")
 
-    async def _translate_text_via_google_http(self, text: str) -> str:
+    def _http_client(self, **kwargs) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        # A pooled client keeps the translate.googleapis.com connection warm.
+        if self._http_pool is not None:
+            return self._http_pool.lease(**kwargs)
+        return httpx.AsyncClient(**kwargs)
+
+    async def _translate_text_via_google_http(self, text: str) -> str | None:
+        # None when the request fails, so callers can tell it from an echo.
         try:
-            async with httpx.AsyncClient(timeout=8, follow_redirects=True) as client:
+            async with self._http_client(timeout=8, follow_redirects=True) as client:
                 response = await client.get(
                     "https://translate.googleapis.com/translate_a/single",
                     params={
@@ -693,14 +991,19 @@ class StatusHostAutomation:
             translated = "".join(
                 str(item[0]) for item in segments if isinstance(item, list) and item
             ).strip()
-            return translated or text
+            return translated or None
         except Exception:
-            return text
+            return None
 
-    @staticmethod
-    def _format_datetime(
-        dt: datetime | None, tzinfo: timezone | ZoneInfo
-    ) -> str:
-        if dt is None:
-            return "horario indisponivel"
-        return dt.astimezone(tzinfo).strftime("%d/%m/%Y %H:%M")
+    async def _translate_batch_via_google_http(
+        self, texts: list[str]
+    ) -> dict[str, str] | None:
+        # One request for the whole section: the endpoint keeps line breaks, so
+        # join the strings one per line and split the translation back.
+        translated = await self._translate_text_via_google_http("\n".join(texts))
+        if translated is None:
+            return None
+        lines = translated.split("\n")
+        if len(lines) != len(texts):
+            return None
+        return {text: line.strip() for text, line in zip(texts, lines) if line.strip()}
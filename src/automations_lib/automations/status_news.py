@@ -49,9 +49,12 @@ class StatusNewsAutomation:
 
     @staticmethod
     def _to_links(items: list) -> str:
-        lines: list[str] = []
-        for idx, item in enumerate(items, start=1):
-            title = html.escape(item.title)
-            link = html.escape(item.link, quote=True)
-            lines.append(f"{idx}. <a href=\"{link}\">{title}</a>")
-        return "\n".join(lines) if lines else "Sem itens no momento."
+        if not items:
+            return "Sem itens no momento."
+        h = html.escape
+        return "\n".join(
+            [
+                f"{idx}. <a href=\"{h(item.link, quote=True)}\">{h(item.title)}</a>"
+                for idx, item in enumerate(items, start=1)
+            ]
+        )
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
 from datetime import timezone
+from functools import lru_cache
 import html
 
 from src.automations_lib.models import AutomationContext, AutomationResult
 from src.automations_lib.providers.trends_provider import TrendsProvider
 
 
+# The source is one of two configured sites, and topics repeat across polls.
+@lru_cache(maxsize=8)
+def _source_line(source_url: str, source_name: str) -> str:
+    return (
+        "Fonte publica alternativa: "
+        f"<a href=\"{html.escape(source_url, quote=True)}\">"
+        f"{html.escape(source_name)}</a>"
+    )
+
+
+@lru_cache(maxsize=256)
+def _escape_topic(topic: str) -> str:
+    return html.escape(topic)
+
+
 class StatusTrendsAutomation:
     name = "status_trends"
     trigger = "status"
@@ -20,20 +36,19 @@ class StatusTrendsAutomation:
             fallback_url=context.settings.trends_fallback_url,
             limit=10,
         )
-        lines = [
-            "<b>Trending Topics (Brasil)</b>",
-            (
-                "Fonte publica alternativa: "
-                f"<a href=\"{html.escape(snapshot.source_url, quote=True)}\">"
-                f"{html.escape(snapshot.source_name)}</a>"
-            ),
-        ]
-        for idx, topic in enumerate(snapshot.trends, start=1):
-            lines.append(f"{idx}. {html.escape(topic)}")
-
+        message = "\n".join(
+            [
+                "<b>Trending Topics (Brasil)</b>",
+                _source_line(snapshot.source_url, snapshot.source_name),
+                *[
+                    f"{idx}. {_escape_topic(topic)}"
+                    for idx, topic in enumerate(snapshot.trends, start=1)
+                ],
+            ]
+        )
         return AutomationResult(
             title="Trends",
-            message="\n".join(lines),
+            message=message,
             source_label=snapshot.source_name,
             generated_at=context.utc_now().astimezone(timezone.utc),
             ok=True,
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from datetime import timezone
-import html
 
 from src.automations_lib.models import AutomationContext, AutomationResult
 from src.automations_lib.providers.weather_provider import WeatherProvider
 
 
+# No HTML-special characters, so it needs no escaping.
+_SOURCE_LABEL = "Open-Meteo"
+
+
 class StatusWeatherAutomation:
     name = "status_weather"
     trigger = "status"
@@ -32,7 +35,7 @@ class StatusWeatherAutomation:
         return AutomationResult(
             title="Clima",
             message=message,
-            source_label=html.escape("Open-Meteo"),
+            source_label=_SOURCE_LABEL,
             generated_at=context.utc_now().astimezone(timezone.utc),
             ok=True,
         )
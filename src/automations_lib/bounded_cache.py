@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from time import monotonic
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class BoundedCache(Generic[K, V]):
+    """Small LRU mapping with an optional per-entry time-to-live."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float | None = None) -> None:
+        self._maxsize = max(1, int(maxsize))
+        self._ttl_seconds = ttl_seconds
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default=None):
+        item = self._data.get(key)
+        if item is None:
+            return default
+        stored_at, value = item
+        if self._ttl_seconds is not None and monotonic() - stored_at > self._ttl_seconds:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._data[key] = (monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -4,8 +4,9 @@ import asyncio
 from datetime import timezone
 import html
 import logging
-from time import perf_counter
+from time import perf_counter_ns
 
+from src.automations_lib.base import Automation
 from src.automations_lib.models import AutomationContext, AutomationResult
 from src.automations_lib.registry import AutomationRegistry
 
@@ -21,26 +22,58 @@ class StatusOrchestrator:
     async def run_trigger(
         self, trigger: str, context: AutomationContext
     ) -> list[AutomationResult]:
-        logger.info(
-            "trigger execution started",
-            extra={
-                "event": "trigger_start",
-                "trace_id": context.trace_id,
-                "trigger": trigger,
-                "chat_id": context.chat_id,
-                "user_id": context.user_id,
-                "username": context.username,
-            },
-        )
-        results: list[AutomationResult] = []
-        for automation in self._registry.get_by_trigger(trigger):
-            start = perf_counter()
-            label = getattr(automation, "name", automation.__class__.__name__)
-            try:
-                result = await asyncio.wait_for(
-                    automation.run(context), timeout=self._timeout_seconds
+        # Skip building the extra dicts entirely when INFO is filtered out.
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "trigger execution started",
+                extra={
+                    "event": "trigger_start",
+                    "trace_id": context.trace_id,
+                    "trigger": trigger,
+                    "chat_id": context.chat_id,
+                    "user_id": context.user_id,
+                    "username": context.username,
+                },
+            )
+        # Automations are network-bound and independent: run them together and
+        # keep the registry order in the results.
+        results = list(
+            await asyncio.gather(
+                *(
+                    self._run_one(automation, trigger, context, log_info)
+                    for automation in self._registry.get_by_trigger(trigger)
                 )
-                elapsed_ms = int((perf_counter() - start) * 1000)
+            )
+        )
+        if log_info:
+            logger.info(
+                "trigger execution finished",
+                extra={
+                    "event": "trigger_end",
+                    "trace_id": context.trace_id,
+                    "trigger": trigger,
+                    "status": "ok",
+                    "result_count": len(results),
+                },
+            )
+        return results
+
+    async def _run_one(
+        self,
+        automation: Automation,
+        trigger: str,
+        context: AutomationContext,
+        log_info: bool,
+    ) -> AutomationResult:
+        start_ns = perf_counter_ns()
+        label = getattr(automation, "name", automation.__class__.__name__)
+        try:
+            result = await asyncio.wait_for(
+                automation.run(context), timeout=self._timeout_seconds
+            )
+            if log_info:
+                elapsed_ns = perf_counter_ns() - start_ns
                 logger.info(
                     "automation execution finished",
                     extra={
@@ -50,45 +83,31 @@ class StatusOrchestrator:
                         "source": label,
                         "status": "ok",
                         "severity": result.severity,
-                        "latency_ms": elapsed_ms,
-                    },
-                )
-                results.append(result)
-            except Exception as exc:  # pragma: no cover - defensive path
-                msg = (
-                    f"<b>{html.escape(label)}</b>\n"
-                    f"Falha ao executar automacao: {html.escape(str(exc))}"
-                )
-                logger.exception(
-                    "automation execution failed",
-                    extra={
-                        "event": "automation_error",
-                        "trace_id": context.trace_id,
-                        "trigger": trigger,
-                        "source": label,
-                        "status": "error",
+                        "latency_ms": elapsed_ns // 1_000_000,
+                        "latency_us": elapsed_ns // 1_000,
                     },
                 )
-                results.append(
-                    AutomationResult(
-                        title=label,
-                        message=msg,
-                        source_label=label,
-                        generated_at=context.utc_now().astimezone(timezone.utc),
-                        ok=False,
-                        severity="critico",
-                    )
-                )
-        logger.info(
-            "trigger execution finished",
-            extra={
-                "event": "trigger_end",
-                "trace_id": context.trace_id,
-                "trigger": trigger,
-                "status": "ok",
-                "result_count": len(results),
-            },
-        )
-        return results
-
-
+            return result
+        except Exception as exc:  # pragma: no cover - defensive path
+            msg = (
+                f"<b>{html.escape(label)}</b>\n"
+                f"Falha ao executar automacao: {html.escape(str(exc))}"
+            )
+            logger.exception(
+                "automation execution failed",
+                extra={
+                    "event": "automation_error",
+                    "trace_id": context.trace_id,
+                    "trigger": trigger,
+                    "source": label,
+                    "status": "error",
+                },
+            )
+            return AutomationResult(
+                title=label,
+                message=msg,
+                source_label=label,
+                generated_at=context.utc_now().astimezone(timezone.utc),
+                ok=False,
+                severity="critico",
+            )
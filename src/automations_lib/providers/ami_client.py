@@ -2,11 +2,42 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Iterable
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from contextlib import AbstractAsyncContextManager
+from functools import lru_cache
 import ssl
+import sys
 import uuid
 
 import httpx
 
+from src.automations_lib.providers.http_pool import HttpClientPool
+
+
+_MESSAGE_END = b"\r\n\r\n"
+# Whole frames are read at once; a PeerEntry is well under 1 KiB.
+_READ_LIMIT = 1 << 20
+# Raw header name -> interned normalized key. AMI uses a small fixed
+# vocabulary, so every PeerEntry shares the same key objects.
+_KEY_NAMES: dict[str, str] = {}
+_KEY_NAMES_MAX = 256
+# Fixed action frames; only the SIPpeers ActionID varies per session.
+_LOGOFF_FRAME = b"Action: Logoff\r\n\r\n"
+_SIPPEERS_TEMPLATE = b"Action: SIPpeers\r\nActionID: %b\r\n\r\n"
+# Pooled rawman clients keep no cookies: each session carries its own
+# mansession_id, and redirects are followed by hand so it survives them.
+_NO_COOKIES = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+_MAX_RAWMAN_REDIRECTS = 5
+
+
+@lru_cache(maxsize=1)
+def _insecure_tls_context() -> ssl.SSLContext:
+    # AMI TLS in Issabel/Asterisk commonly uses self-signed certs.
+    ssl_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ssl_ctx.check_hostname = False
+    ssl_ctx.verify_mode = ssl.CERT_NONE
+    return ssl_ctx
+
 
 class AmiError(Exception):
     pass
@@ -33,79 +64,84 @@ class AmiClient:
     async def run_sip_peers(self) -> list[dict[str, str]]:
         writer: asyncio.StreamWriter | None = None
         try:
-            ssl_ctx: ssl.SSLContext | None = None
-            if self._use_tls:
-                # AMI TLS in Issabel/Asterisk commonly uses self-signed certs.
-                ssl_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-                ssl_ctx.check_hostname = False
-                ssl_ctx.verify_mode = ssl.CERT_NONE
+            ssl_ctx = _insecure_tls_context() if self._use_tls else None
 
             reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(self._host, self._port, ssl=ssl_ctx),
+                asyncio.open_connection(
+                    self._host, self._port, ssl=ssl_ctx, limit=_READ_LIMIT
+                ),
                 timeout=self._timeout_seconds,
             )
-            # Banner line, e.g. "Asterisk Call Manager/5.0".
-            await self._readline(reader, allow_timeout=True)
-
-            login_id = self._new_action_id()
-            await self._send_action(
-                writer,
-                [
-                    "Action: Login",
-                    f"Username: {self._username}",
-                    f"Secret: {self._secret}",
-                    "Events: off",
-                    f"ActionID: {login_id}",
-                ],
-            )
-            login_resp = await self._wait_for_response(reader, action_id=login_id)
-            if login_resp.get("response", "").strip().lower() != "success":
-                message = login_resp.get("message", "").strip() or "unknown"
-                raise AmiError(f"login failed: {message}")
-
-            action_id = self._new_action_id()
-            await self._send_action(
-                writer,
-                [
-                    "Action: SIPpeers",
-                    f"ActionID: {action_id}",
-                ],
-            )
+            # Banner line, e.g. "Asterisk Call Manager/5.0"; optional. Its line
+            # ending tells whether whole CRLF frames can be read at once; some
+            # proxies and test PBXs send LF-only frames.
+            crlf_frames = False
+            try:
+                async with asyncio.timeout(self._timeout_seconds):
+                    crlf_frames = (await reader.readline()).endswith(b"\r\n")
+            except asyncio.TimeoutError:
+                pass
 
-            entries: list[dict[str, str]] = []
-            sippeers_response_seen = False
-            while True:
-                msg = await self._read_message(reader)
-                if msg is None:
-                    break
-                if not msg:
-                    continue
-
-                response = msg.get("response", "").strip().lower()
-                if response:
-                    if not sippeers_response_seen:
-                        sippeers_response_seen = True
-                        if response != "success":
-                            message = msg.get("message", "").strip() or "unknown"
-                            if "permission denied" in message.lower():
-                                raise AmiError("sippeers failed: permission denied")
-                            raise AmiError(f"sippeers failed: {message}")
-                    continue
-
-                event = msg.get("event", "").strip().lower()
-                if event == "peerentry":
-                    entries.append(msg)
-                    continue
-                if event == "peerlistcomplete":
-                    break
+            # One idle deadline for the whole session, pushed forward on every
+            # read, instead of a wait_for task per line.
+            async with asyncio.timeout(None) as idle:
+                login_id = self._new_action_id()
+                await self._send_action(
+                    writer,
+                    [
+                        "Action: Login",
+                        f"Username: {self._username}",
+                        f"Secret: {self._secret}",
+                        "Events: off",
+                        f"ActionID: {login_id}",
+                    ],
+                )
+                login_resp = await self._wait_for_response(
+                    reader, idle, action_id=login_id, crlf_frames=crlf_frames
+                )
+                if login_resp.get("response", "").strip().lower() != "success":
+                    message = login_resp.get("message", "").strip() or "unknown"
+                    raise AmiError(f"login failed: {message}")
+
+                action_id = self._new_action_id()
+                await self._send_frame(
+                    writer, _SIPPEERS_TEMPLATE % action_id.encode("ascii")
+                )
+
+                entries: list[dict[str, str]] = []
+                sippeers_response_seen = False
+                while True:
+                    msg = await self._read_message(reader, idle, crlf_frames)
+                    if msg is None:
+                        break
+                    if not msg:
+                        continue
 
-            return entries
+                    response = msg.get("response", "").strip().lower()
+                    if response:
+                        if not sippeers_response_seen:
+                            sippeers_response_seen = True
+                            if response != "success":
+                                message = msg.get("message", "").strip() or "unknown"
+                                if "permission denied" in message.lower():
+                                    raise AmiError("sippeers failed: permission denied")
+                                raise AmiError(f"sippeers failed: {message}")
+                        continue
+
+                    event = msg.get("event", "").strip().lower()
+                    if event == "peerentry":
+                        entries.append(msg)
+                        continue
+                    if event == "peerlistcomplete":
+                        break
+
+                return entries
         except asyncio.TimeoutError as exc:
             raise AmiError("timeout") from exc
         finally:
             if writer is not None:
                 try:
-                    await self._send_action(writer, ["Action: Logoff"])
+                    await self._send_frame(writer, _LOGOFF_FRAME)
                 except Exception:
                     pass
                 try:
@@ -124,11 +160,13 @@ class AmiClient:
     async def _wait_for_response(
         self,
         reader: asyncio.StreamReader,
+        idle: asyncio.Timeout,
         *,
         action_id: str,
+        crlf_frames: bool,
     ) -> dict[str, str]:
         while True:
-            msg = await self._read_message(reader)
+            msg = await self._read_message(reader, idle, crlf_frames)
             if msg is None:
                 raise AmiError("connection closed")
             if not msg:
@@ -139,45 +177,47 @@ class AmiClient:
                     return msg
 
     async def _read_message(
-        self, reader: asyncio.StreamReader
+        self, reader: asyncio.StreamReader, idle: asyncio.Timeout, crlf_frames: bool
     ) -> dict[str, str] | None:
-        result: dict[str, str] = {}
-        saw_any_line = False
-        while True:
-            line = await self._readline(reader)
-            if line is None:
-                return None if not saw_any_line else result
-            if line == "":
-                return result
-            saw_any_line = True
-            if ":" not in line:
-                continue
-            key, value = line.split(":", maxsplit=1)
-            key = key.strip().lower()
-            if not key:
-                continue
-            result[key] = value.lstrip()
-
-    async def _readline(
-        self,
-        reader: asyncio.StreamReader,
-        *,
-        allow_timeout: bool = False,
-    ) -> str | None:
+        if not crlf_frames:
+            return await self._read_message_lines(reader, idle)
+        # AMI frames end with a blank line: take the whole frame in one read.
+        idle.reschedule(asyncio.get_running_loop().time() + self._timeout_seconds)
         try:
-            raw = await asyncio.wait_for(reader.readline(), timeout=self._timeout_seconds)
-        except asyncio.TimeoutError as exc:
-            if allow_timeout:
+            block = await reader.readuntil(_MESSAGE_END)
+        except asyncio.IncompleteReadError as exc:
+            if not exc.partial:
                 return None
-            raise AmiError("timeout") from exc
-        if raw == b"":
-            return None
-        return raw.decode(errors="replace").rstrip("\r\n")
+            block = exc.partial
+        except asyncio.LimitOverrunError as exc:
+            raise AmiError("message too large") from exc
+        return _parse_message(block.decode(errors="replace"))
+
+    async def _read_message_lines(
+        self, reader: asyncio.StreamReader, idle: asyncio.Timeout
+    ) -> dict[str, str] | None:
+        # Line-at-a-time fallback for peers whose frames may end in a bare LF.
+        lines: list[bytes] = []
+        while True:
+            idle.reschedule(asyncio.get_running_loop().time() + self._timeout_seconds)
+            line = await reader.readline()
+            if not line:
+                if not lines:
+                    return None
+                break
+            if line in (b"\n", b"\r\n"):
+                break
+            lines.append(line)
+        return _parse_message(b"".join(lines).decode(errors="replace"))
 
     @staticmethod
     async def _send_action(writer: asyncio.StreamWriter, lines: list[str]) -> None:
         payload = "\r\n".join(lines) + "\r\n\r\n"
-        writer.write(payload.encode("utf-8"))
+        await AmiClient._send_frame(writer, payload.encode("utf-8"))
+
+    @staticmethod
+    async def _send_frame(writer: asyncio.StreamWriter, frame: bytes) -> None:
+        writer.write(frame)
         await writer.drain()
 
 
@@ -189,18 +229,29 @@ class AmiHttpRawmanClient:
         username: str,
         secret: str,
         timeout_seconds: int = 8,
+        http_pool: HttpClientPool | None = None,
     ) -> None:
         self._rawman_url = rawman_url
         self._username = username
         self._secret = secret
         self._timeout_seconds = max(1, int(timeout_seconds))
+        self._http_pool = http_pool
+
+    def _client(self, **kwargs) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        if self._http_pool is not None:
+            return self._http_pool.lease(cookies=_NO_COOKIES, **kwargs)
+        return httpx.AsyncClient(**kwargs)
 
     async def run_sip_peers(self) -> list[dict[str, str]]:
         timeout = httpx.Timeout(self._timeout_seconds)
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        # A pooled client is shared with other callers, so this login's rawman
+        # session cookie is carried explicitly.
+        session: dict[str, str] = {}
+        async with self._client(timeout=timeout, follow_redirects=False) as client:
             try:
                 login_text = await self._request_rawman(
                     client,
+                    session,
                     params={
                         "action": "login",
                         "username": self._username,
@@ -218,6 +269,7 @@ class AmiHttpRawmanClient:
 
                 sippeers_text = await self._request_rawman(
                     client,
+                    session,
                     params={"action": "SIPpeers"},
                     phase="sippeers",
                 )
@@ -238,7 +290,7 @@ class AmiHttpRawmanClient:
                 # Best effort; never mask original failure.
                 try:
                     await self._request_rawman(
-                        client, params={"action": "logoff"}, phase="logoff"
+                        client, session, params={"action": "logoff"}, phase="logoff"
                     )
                 except Exception:
                     pass
@@ -246,12 +298,28 @@ class AmiHttpRawmanClient:
     async def _request_rawman(
         self,
         client: httpx.AsyncClient,
+        session: dict[str, str],
         *,
         params: dict[str, str],
         phase: str,
     ) -> str:
+        # httpx rebuilds the Cookie header from the client's jar on redirects,
+        # so they are followed here with this session's cookie re-applied.
+        url: httpx.URL | str = self._rawman_url
+        request_params: dict[str, str] | None = params
         try:
-            response = await client.get(self._rawman_url, params=params)
+            for _ in range(_MAX_RAWMAN_REDIRECTS + 1):
+                cookie = "; ".join(f"{name}={value}" for name, value in session.items())
+                response = await client.get(
+                    url, params=request_params, headers={"Cookie": cookie}
+                )
+                session.update(response.cookies.items())
+                if response.next_request is None:
+                    break
+                url = response.next_request.url
+                request_params = None
+            else:
+                raise AmiError(f"{phase} failed: too many redirects")
             response.raise_for_status()
             return response.text or ""
         except httpx.TimeoutException as exc:
@@ -266,24 +334,37 @@ class AmiHttpRawmanClient:
 def parse_rawman_messages(text: str) -> list[dict[str, str]]:
     if text is None:
         raise AmiError("invalid rawman response")
-    normalized = text.replace("\r\n", "\n")
-    blocks = [block.strip() for block in normalized.split("\n\n") if block.strip()]
     messages: list[dict[str, str]] = []
-    for block in blocks:
-        message: dict[str, str] = {}
-        for line in block.split("\n"):
-            if ":" not in line:
-                continue
-            key, value = line.split(":", maxsplit=1)
-            key = key.strip().lower()
-            if not key:
-                continue
-            message[key] = value.strip()
+    # Blank and whitespace-only blocks yield no fields, so they need no pre-strip.
+    for block in text.replace("\r\n", "\n").split("\n\n"):
+        message = _parse_message(block)
         if message:
             messages.append(message)
     return messages
 
 
+def _parse_message(block: str) -> dict[str, str]:
+    # Lines may still end in "\r"; strip() drops it with the padding.
+    message: dict[str, str] = {}
+    key_names = _KEY_NAMES
+    for line in block.split("\n"):
+        raw_key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = key_names.get(raw_key) or _normalize_key(raw_key)
+        if not key:
+            continue
+        message[key] = value.strip()
+    return message
+
+
+def _normalize_key(raw_key: str) -> str:
+    key = sys.intern(raw_key.strip().lower())
+    if len(_KEY_NAMES) < _KEY_NAMES_MAX:
+        _KEY_NAMES[raw_key] = key
+    return key
+
+
 def _first_response(messages: Iterable[dict[str, str]]) -> dict[str, str]:
     for message in messages:
         if message.get("response"):
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 import re
 
 import httpx
 
+from src.automations_lib.bounded_cache import BoundedCache
+from src.automations_lib.providers.http_pool import HttpClientPool
+from src.automations_lib.singleflight import SingleFlight
+
 
 @dataclass(frozen=True)
 class CepInfo:
@@ -19,15 +24,41 @@ class CepInfo:
 
 class CepProvider:
     CEP_REGEX = re.compile(r"^\d{8}$")
+    NON_DIGITS_REGEX = re.compile(r"\D+")
 
-    def __init__(self, timeout_seconds: int, url_template: str) -> None:
+    def __init__(
+        self,
+        timeout_seconds: int,
+        url_template: str,
+        http_pool: HttpClientPool | None = None,
+        cache_size: int = 1024,
+        cache_ttl_seconds: float = 24 * 60 * 60,
+    ) -> None:
         self._timeout_seconds = timeout_seconds
         self._url_template = url_template
+        self._http_pool = http_pool
+        # CEP addresses change on the scale of months; keep answers for a day.
+        self._cache: BoundedCache[str, CepInfo] = BoundedCache(
+            maxsize=cache_size,
+            ttl_seconds=cache_ttl_seconds,
+        )
+        self._single_flight: SingleFlight[CepInfo] = SingleFlight()
+
+    def _client(self, **kwargs) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        if self._http_pool is not None:
+            return self._http_pool.lease(**kwargs)
+        return httpx.AsyncClient(**kwargs)
 
     async def lookup(self, raw_cep: str) -> CepInfo:
         cep = self._normalize_cep(raw_cep)
+        cached = self._cache.get(cep)
+        if cached is not None:
+            return cached
+        return await self._single_flight.run(cep, lambda: self._fetch(cep))
+
+    async def _fetch(self, cep: str) -> CepInfo:
         url = self._url_template.format(cep=cep)
-        async with httpx.AsyncClient(
+        async with self._client(
             timeout=self._timeout_seconds,
             follow_redirects=True,
         ) as client:
@@ -36,7 +67,7 @@ class CepProvider:
         payload = response.json()
         if payload.get("erro") is True:
             raise ValueError("CEP nao encontrado.")
-        return CepInfo(
+        info = CepInfo(
             cep=str(payload.get("cep", cep)).strip(),
             logradouro=str(payload.get("logradouro", "")).strip(),
             complemento=str(payload.get("complemento", "")).strip(),
@@ -45,9 +76,11 @@ class CepProvider:
             uf=str(payload.get("uf", "")).strip(),
             ibge=str(payload.get("ibge", "")).strip(),
         )
+        self._cache[cep] = info
+        return info
 
     def _normalize_cep(self, raw_cep: str) -> str:
-        digits = re.sub(r"\D+", "", raw_cep or "")
+        digits = self.NON_DIGITS_REGEX.sub("", raw_cep or "")
         if not self.CEP_REGEX.match(digits):
             raise ValueError("CEP invalido. Use 8 digitos.")
         return digits
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
 import httpx
 
+from src.automations_lib.providers.http_pool import HttpClientPool
+
 
 @dataclass(frozen=True)
 class QuoteValue:
@@ -26,11 +29,21 @@ class FinanceSnapshot:
 class FinanceProvider:
     HGBRASIL_B3_URL = "https://api.hgbrasil.com/finance?format=json-cors&key=00000000"
 
-    def __init__(self, timeout_seconds: int) -> None:
+    def __init__(
+        self,
+        timeout_seconds: int,
+        http_pool: HttpClientPool | None = None,
+    ) -> None:
         self._timeout_seconds = timeout_seconds
+        self._http_pool = http_pool
+
+    def _client(self, **kwargs) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        if self._http_pool is not None:
+            return self._http_pool.lease(**kwargs)
+        return httpx.AsyncClient(**kwargs)
 
     async def fetch_snapshot(self, awesome_url: str, yahoo_b3_url: str) -> FinanceSnapshot:
-        async with httpx.AsyncClient(timeout=self._timeout_seconds) as client:
+        async with self._client(timeout=self._timeout_seconds) as client:
             awesome_result, yahoo_result = await asyncio.gather(
                 client.get(awesome_url),
                 client.get(yahoo_b3_url),
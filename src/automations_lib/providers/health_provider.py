@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from time import perf_counter
 
 import httpx
 
+from src.automations_lib.providers.http_pool import HttpClientPool
+
 
 @dataclass(frozen=True)
 class HealthProbe:
@@ -19,16 +23,35 @@ class HealthProbe:
 
 
 class HealthProvider:
-    def __init__(self, timeout_seconds: int) -> None:
+    def __init__(
+        self,
+        timeout_seconds: int,
+        max_concurrency: int = 8,
+        http_pool: HttpClientPool | None = None,
+    ) -> None:
         self._timeout_seconds = timeout_seconds
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._http_pool = http_pool
+
+    def _client(self, **kwargs) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        if self._http_pool is not None:
+            return self._http_pool.lease(**kwargs)
+        return httpx.AsyncClient(**kwargs)
 
-    async def fetch_health(self, probes: list[tuple[str, str]]) -> list[HealthProbe]:
-        async with httpx.AsyncClient(
+    async def fetch_health(self, probes: Sequence[tuple[str, str]]) -> list[HealthProbe]:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def run_bounded(client: httpx.AsyncClient, source: str, url: str) -> HealthProbe:
+            async with semaphore:
+                return await self._run_single_probe(client, source, url)
+
+        async with self._client(
             timeout=self._timeout_seconds,
             follow_redirects=True,
+            limits=httpx.Limits(max_connections=self._max_concurrency),
         ) as client:
             results = await asyncio.gather(
-                *(self._run_single_probe(client, source, url) for source, url in probes)
+                *(run_bounded(client, source, url) for source, url in probes)
             )
         return list(results)
 
@@ -40,7 +63,10 @@ class HealthProvider:
     ) -> HealthProbe:
         start = perf_counter()
         try:
-            response = await client.get(url)
+            # Hard per-probe deadline so a hung host cannot pin a semaphore slot.
+            response = await asyncio.wait_for(
+                client.get(url), timeout=self._timeout_seconds
+            )
             elapsed_ms = int((perf_counter() - start) * 1000)
             return HealthProbe(
                 source=source,
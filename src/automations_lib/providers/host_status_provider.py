@@ -1,12 +1,30 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
 import httpx
 
+from src.automations_lib.providers.http_pool import HttpClientPool
+from src.automations_lib.timezones import resolve_timezone
+
+
+META_WHATSAPP_ORG = "whatsapp-business-api"
+
+
+@lru_cache(maxsize=16)
+def meta_whatsapp_outages_url(outages_template: str) -> str:
+    return outages_template.format(org=META_WHATSAPP_ORG)
+
+
+@lru_cache(maxsize=32)
+def meta_whatsapp_metric_url(metrics_template: str, metric: str) -> str:
+    return metrics_template.format(org=META_WHATSAPP_ORG, metric=metric)
+
 
 def _parse_dt(value: str | None) -> datetime | None:
     if not value:
@@ -25,15 +43,6 @@ def _parse_dt(value: str | None) -> datetime | None:
     return parsed
 
 
-def _resolve_timezone(timezone_name: str) -> timezone | ZoneInfo:
-    try:
-        return ZoneInfo(timezone_name)
-    except ZoneInfoNotFoundError:
-        if timezone_name == "America/Sao_Paulo":
-            return timezone(timedelta(hours=-3))
-        return timezone.utc
-
-
 def _is_today_in_timezone(dt: datetime | None, tzinfo: timezone | ZoneInfo) -> bool:
     if dt is None:
         return False
@@ -50,6 +59,12 @@ def _is_today_or_yesterday_in_timezone(
     return candidate in {current_date, current_date - timedelta(days=1)}
 
 
+def _normalize_status(value: object) -> str:
+    # Statuspage sends lowercase snake_case; normalizing once here keeps the
+    # report consumers on exact-match comparisons.
+    return str(value).strip().lower()
+
+
 def _title_case_status(status: str) -> str:
     if not status:
         return "Unknown"
@@ -123,7 +138,7 @@ class HostMaintenance:
     scheduled_until: datetime | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WebsiteCheckResult:
     label: str
     url: str
@@ -151,7 +166,7 @@ class HostStatusProvider:
         "admin-center": "Meta Admin Center",
         "workplace": "Workplace from Meta",
         "messenger": "Messenger Platform",
-        "whatsapp-business-api": "WhatsApp Business API",
+        META_WHATSAPP_ORG: "WhatsApp Business API",
     }
 
     UMBRELLA_STATUS_HUMAN = {
@@ -166,10 +181,17 @@ class HostStatusProvider:
         timeout_seconds: int,
         report_timezone: str,
         site_targets: tuple[tuple[str, str], ...] = (),
+        http_pool: HttpClientPool | None = None,
     ) -> None:
         self._timeout_seconds = timeout_seconds
-        self._report_tz = _resolve_timezone(report_timezone)
+        self._report_tz = resolve_timezone(report_timezone)
         self._site_targets = tuple(site_targets)
+        self._http_pool = http_pool
+
+    def _client(self, **kwargs) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        if self._http_pool is not None:
+            return self._http_pool.lease(**kwargs)
+        return httpx.AsyncClient(**kwargs)
 
     async def fetch_snapshot(
         self,
@@ -230,7 +252,7 @@ class HostStatusProvider:
             "Outros": "Outros...",
         }
         try:
-            async with httpx.AsyncClient(
+            async with self._client(
                 timeout=self._timeout_seconds,
                 follow_redirects=True,
             ) as client:
@@ -261,7 +283,9 @@ class HostStatusProvider:
                 ),
                 None,
             )
-            component_statuses[label] = str(match.get("status", "unknown")) if match else "not_found"
+            component_statuses[label] = (
+                _normalize_status(match.get("status", "unknown")) if match else "not_found"
+            )
 
         all_operational = all(status == "operational" for status in component_statuses.values())
         incidents_today = self._locaweb_incidents_today(incidents_payload)
@@ -316,7 +340,7 @@ class HostStatusProvider:
         metrics_template: str,
     ) -> MetaReport:
         try:
-            async with httpx.AsyncClient(
+            async with self._client(
                 timeout=self._timeout_seconds,
                 follow_redirects=True,
             ) as client:
@@ -348,7 +372,9 @@ class HostStatusProvider:
                 )
                 continue
             statuses = [str(service.get("status", "unknown")) for service in org.get("services", [])]
-            all_no_known_issues = len(statuses) > 0 and all(status == "No known issues" for status in statuses)
+            all_no_known_issues = len(statuses) > 0 and all(
+                status.strip().lower() == "no known issues" for status in statuses
+            )
             org_reports.append(
                 MetaOrgReport(
                     org_id=org_id,
@@ -372,20 +398,17 @@ class HostStatusProvider:
     async def _fetch_meta_whatsapp_metrics(
         self, metrics_template: str
     ) -> tuple[float | None, float | None, float | None]:
-        def metric_url(metric: str) -> str:
-            return metrics_template.format(org="whatsapp-business-api", metric=metric)
-
         metric_names = [
             "cloudapi_uptime_daily",
             "event_tagging_latency_last_31_days_p90_s3",
             "event_tagging_latency_last_31_days_p99_s3",
         ]
-        async with httpx.AsyncClient(
+        async with self._client(
             timeout=self._timeout_seconds,
             follow_redirects=True,
         ) as client:
             responses = await asyncio.gather(
-                *(client.get(metric_url(name)) for name in metric_names),
+                *(client.get(meta_whatsapp_metric_url(metrics_template, name)) for name in metric_names),
                 return_exceptions=True,
             )
 
@@ -410,9 +433,9 @@ class HostStatusProvider:
     async def _fetch_meta_whatsapp_incidents_today(
         self, outages_template: str
     ) -> list[HostIncident]:
-        url = outages_template.format(org="whatsapp-business-api")
+        url = meta_whatsapp_outages_url(outages_template)
         try:
-            async with httpx.AsyncClient(
+            async with self._client(
                 timeout=self._timeout_seconds,
                 follow_redirects=True,
             ) as client:
@@ -463,7 +486,7 @@ class HostStatusProvider:
     ) -> HostingerReport:
         del hostinger_components_url, hostinger_incidents_url, hostinger_status_page_url
         try:
-            async with httpx.AsyncClient(
+            async with self._client(
                 timeout=self._timeout_seconds,
                 follow_redirects=True,
                 verify=False,
@@ -615,7 +638,7 @@ class HostStatusProvider:
         return result
 
     async def _fetch_websites(self) -> WebsiteChecksReport:
-        async with httpx.AsyncClient(
+        async with self._client(
             timeout=self._timeout_seconds,
             follow_redirects=True,
             verify=False,
@@ -659,7 +682,7 @@ class HostStatusProvider:
         incidents_url: str,
     ) -> UmbrellaReport:
         try:
-            async with httpx.AsyncClient(
+            async with self._client(
                 timeout=self._timeout_seconds,
                 follow_redirects=True,
             ) as client:
@@ -701,7 +724,9 @@ class HostStatusProvider:
                     ),
                     None,
                 )
-            component_statuses[target] = str(match.get("status", "not_found")) if match else "not_found"
+            component_statuses[target] = (
+                _normalize_status(match.get("status", "not_found")) if match else "not_found"
+            )
 
         component_statuses_human = {
             name: self.UMBRELLA_STATUS_HUMAN.get(status, _title_case_status(status))
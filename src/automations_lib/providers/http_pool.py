@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from typing import Any
+
+import httpx
+
+from src.automations_lib.providers.rate_limit import HostRateLimiter
+
+# (requests, seconds) per upstream host; keeps bursts of /status under provider quotas.
+# Status pages publish no quota; one host report makes at most ~5 calls per page.
+DEFAULT_HOST_RATE_LIMITS: Mapping[str, tuple[float, float]] = {
+    "awesomeapi.com.br": (30, 60),
+    "finance.yahoo.com": (60, 60),
+    "hgbrasil.com": (30, 60),
+    "statusblog.locaweb.com.br": (60, 60),
+    "metastatus.com": (60, 60),
+    "status.umbrella.com": (60, 60),
+    "statuspage.hostinger.com": (60, 60),
+}
+
+
+class HttpClientPool:
+    """Long-lived httpx clients shared by providers so keep-alive connections are reused.
+
+    One client is kept per distinct option set (timeout, redirects, TLS verification).
+    Leased clients must not be closed by callers; the owner calls ``aclose`` on shutdown.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 128,
+        max_keepalive_connections: int = 64,
+        keepalive_expiry: float = 30.0,
+        host_rate_limits: Mapping[str, tuple[float, float]] = DEFAULT_HOST_RATE_LIMITS,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._rate_limiter = HostRateLimiter(host_rate_limits)
+        self._clients: dict[tuple[tuple[str, str], ...], httpx.AsyncClient] = {}
+
+    def get(self, **kwargs: Any) -> httpx.AsyncClient:
+        # Connection limits are pool-wide; per-call limits would split the pool.
+        kwargs.pop("limits", None)
+        key = tuple(sorted((name, repr(value)) for name, value in kwargs.items()))
+        client = self._clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=self._limits,
+                event_hooks={"request": [self._throttle]},
+                **kwargs,
+            )
+            self._clients[key] = client
+        return client
+
+    async def _throttle(self, request: httpx.Request) -> None:
+        await self._rate_limiter.acquire(request.url.host)
+
+    @asynccontextmanager
+    async def lease(self, **kwargs: Any) -> AsyncIterator[httpx.AsyncClient]:
+        yield self.get(**kwargs)
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
@@ -9,6 +9,7 @@ from src.automations_lib.providers.ami_client import (
     AmiError,
     AmiHttpRawmanClient,
 )
+from src.automations_lib.providers.http_pool import HttpClientPool
 
 
 @dataclass(frozen=True)
@@ -125,6 +126,7 @@ class IssabelAmiProvider:
         timeout_seconds: int = 8,
         use_tls: bool = False,
         peer_name_regex: str = r"^\d+$",
+        http_pool: HttpClientPool | None = None,
     ) -> None:
         self._host = host
         self._rawman_url = rawman_url
@@ -134,6 +136,7 @@ class IssabelAmiProvider:
         self._timeout_seconds = max(1, int(timeout_seconds))
         self._use_tls = bool(use_tls)
         self._peer_name_regex = peer_name_regex or r"^\d+$"
+        self._http_pool = http_pool
 
     async def _run_sip_peers(self) -> list[dict[str, str]]:
         if not self._username or not self._secret:
@@ -144,6 +147,7 @@ class IssabelAmiProvider:
                 username=self._username,
                 secret=self._secret,
                 timeout_seconds=self._timeout_seconds,
+                http_pool=self._http_pool,
             )
         else:
             if not self._host:
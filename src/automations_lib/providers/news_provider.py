@@ -8,12 +8,14 @@ import html
 import logging
 from pathlib import Path
 from time import struct_time
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from zoneinfo import ZoneInfo
 
 from bs4 import BeautifulSoup
 import feedparser
 import httpx
 
+from src.automations_lib.timezones import resolve_timezone
+
 logger = logging.getLogger(__name__)
 
 ROOT_DIR = Path(__file__).resolve().parents[3]
@@ -251,7 +253,7 @@ class NewsProvider:
         blocked_terms: tuple[str, ...],
         timezone_name: str,
     ) -> tuple[list[NewsItem], list[NewsItem]]:
-        tzinfo = self._resolve_timezone(timezone_name)
+        tzinfo = resolve_timezone(timezone_name)
         today = self._now_in_timezone(tzinfo).date()
         yesterday = today - timedelta(days=1)
         today_items: list[NewsItem] = []
@@ -338,15 +340,6 @@ class NewsProvider:
                 return datetime(*raw_value[:6], tzinfo=timezone.utc)
         return None
 
-    @staticmethod
-    def _resolve_timezone(timezone_name: str) -> timezone | ZoneInfo:
-        try:
-            return ZoneInfo(timezone_name)
-        except ZoneInfoNotFoundError:
-            if timezone_name == "America/Sao_Paulo":
-                return timezone(timedelta(hours=-3))
-            return timezone.utc
-
     @staticmethod
     def _now_in_timezone(tzinfo: timezone | ZoneInfo) -> datetime:
         return datetime.now(tzinfo)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from time import monotonic
+from types import TracebackType
+
+
+class AsyncRateLimiter:
+    """Leaky-bucket limiter allowing ``max_rate`` acquisitions per ``time_period`` seconds."""
+
+    def __init__(self, max_rate: float, time_period: float = 60.0) -> None:
+        self._max_rate = max(1.0, float(max_rate))
+        self._rate_per_sec = self._max_rate / max(float(time_period), 1e-6)
+        self._level = 0.0
+        self._last_check = monotonic()
+        self._lock = asyncio.Lock()
+
+    def _leak(self) -> None:
+        now = monotonic()
+        elapsed = now - self._last_check
+        self._level = max(self._level - elapsed * self._rate_per_sec, 0.0)
+        self._last_check = now
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock so the bucket is drained in arrival order.
+        async with self._lock:
+            while True:
+                self._leak()
+                if self._level + 1 <= self._max_rate:
+                    self._level += 1
+                    return
+                await asyncio.sleep((self._level + 1 - self._max_rate) / self._rate_per_sec)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+
+class HostRateLimiter:
+    """Routes requests to a per-host limiter; hosts match exactly or by parent domain."""
+
+    def __init__(self, host_limits: Mapping[str, tuple[float, float]]) -> None:
+        self._limiters = {
+            host.lower(): AsyncRateLimiter(max_rate, time_period)
+            for host, (max_rate, time_period) in host_limits.items()
+        }
+        self._resolved: dict[str, AsyncRateLimiter | None] = {}
+
+    def limiter_for(self, host: str) -> AsyncRateLimiter | None:
+        host = host.lower()
+        try:
+            return self._resolved[host]
+        except KeyError:
+            pass
+        limiter = None
+        for suffix, candidate in self._limiters.items():
+            if host == suffix or host.endswith(f".{suffix}"):
+                limiter = candidate
+                break
+        self._resolved[host] = limiter
+        return limiter
+
+    async def acquire(self, host: str) -> None:
+        limiter = self.limiter_for(host)
+        if limiter is not None:
+            await limiter.acquire()
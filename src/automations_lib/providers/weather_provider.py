@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from datetime import datetime
 
 import httpx
 
+from src.automations_lib.providers.http_pool import HttpClientPool
+from src.automations_lib.timezones import resolve_timezone
+
 
 @dataclass(frozen=True)
 class WeatherSnapshot:
@@ -22,10 +25,20 @@ class WeatherProvider:
     GEOCODE_URL = "https://geocoding-api.open-meteo.com/v1/search"
     FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
 
-    def __init__(self, timeout_seconds: int) -> None:
+    def __init__(
+        self,
+        timeout_seconds: int,
+        http_pool: HttpClientPool | None = None,
+    ) -> None:
         self._timeout_seconds = timeout_seconds
+        self._http_pool = http_pool
         self._cached_coords: tuple[float, float] | None = None
 
+    def _client(self, **kwargs) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        if self._http_pool is not None:
+            return self._http_pool.lease(**kwargs)
+        return httpx.AsyncClient(**kwargs)
+
     async def fetch_weather(self, city_name: str, timezone_name: str) -> WeatherSnapshot:
         coords = await self._get_coordinates(city_name)
         payload = await self._get_forecast(coords[0], coords[1], timezone_name)
@@ -34,20 +47,14 @@ class WeatherProvider:
 
     @staticmethod
     def current_local_datetime(timezone_name: str) -> datetime:
-        try:
-            return datetime.now(ZoneInfo(timezone_name))
-        except ZoneInfoNotFoundError:
-            # Windows environments may not have IANA tzdata available by default.
-            if timezone_name == "America/Sao_Paulo":
-                return datetime.now(timezone(timedelta(hours=-3)))
-            return datetime.now(timezone.utc)
+        return datetime.now(resolve_timezone(timezone_name))
 
     async def _get_coordinates(self, city_name: str) -> tuple[float, float]:
         if self._cached_coords:
             return self._cached_coords
 
         params = {"name": city_name, "count": 1, "language": "pt", "format": "json"}
-        async with httpx.AsyncClient(timeout=self._timeout_seconds) as client:
+        async with self._client(timeout=self._timeout_seconds) as client:
             response = await client.get(self.GEOCODE_URL, params=params)
             response.raise_for_status()
             data = response.json()
@@ -70,7 +77,7 @@ class WeatherProvider:
             "timezone": timezone_name,
             "forecast_days": 1,
         }
-        async with httpx.AsyncClient(timeout=self._timeout_seconds) as client:
+        async with self._client(timeout=self._timeout_seconds) as client:
             response = await client.get(self.FORECAST_URL, params=params)
             response.raise_for_status()
             return response.json()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Share one in-flight execution between concurrent callers of the same key."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[T]] = {}
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _done: self._forget(key, _done))
+        # Shield so one caller timing out does not cancel the shared work.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from datetime import timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+@lru_cache(maxsize=16)
+def resolve_timezone(timezone_name: str) -> timezone | ZoneInfo:
+    """Resolve a configured zone name once; reports and queries ask for it on every call."""
+    try:
+        return ZoneInfo(timezone_name)
+    except ZoneInfoNotFoundError:
+        # Windows environments may not have IANA tzdata available by default.
+        if timezone_name == "America/Sao_Paulo":
+            return timezone(timedelta(hours=-3))
+        return timezone.utc
@@ -16,6 +16,7 @@ from src.automations_lib.models import AutomationContext
 from src.automations_lib.orchestrator import StatusOrchestrator
 from src.automations_lib.providers.ami_client import AmiError
 from src.automations_lib.providers.cep_provider import CepProvider
+from src.automations_lib.providers.http_pool import HttpClientPool
 from src.automations_lib.providers.issabel_ami_provider import IssabelAmiProvider
 from src.automations_lib.providers.link_summary_provider import (
     LinkSummaryProvider,
@@ -100,6 +101,7 @@ class BotHandlers:
         zabbix_provider: ZabbixProvider | None = None,
         link_summary_provider: LinkSummaryProvider | None = None,
         bridge_notifier: BridgeNotifier | None = None,
+        http_pool: HttpClientPool | None = None,
     ) -> None:
         self._settings = settings
         self._orchestrator = orchestrator
@@ -113,6 +115,7 @@ class BotHandlers:
         self._cep_provider = cep_provider or CepProvider(
             timeout_seconds=settings.request_timeout_seconds,
             url_template=settings.viacep_url_template,
+            http_pool=http_pool,
         )
         self._network_provider = network_provider or NetworkDiagnosticsProvider(
             ping_count=settings.ping_count,
@@ -141,6 +144,7 @@ class BotHandlers:
             timeout_seconds=settings.issabel_ami_timeout_seconds,
             use_tls=settings.issabel_ami_use_tls,
             peer_name_regex=settings.issabel_ami_peer_name_regex,
+            http_pool=http_pool,
         )
         self._zabbix_provider = zabbix_provider
         if (
@@ -14,6 +14,7 @@ from telegram.ext import Application
 
 from src.automations_lib.models import AutomationContext, AutomationResult
 from src.automations_lib.orchestrator import StatusOrchestrator
+from src.automations_lib.providers.http_pool import HttpClientPool
 from src.automations_lib.providers.ami_client import AmiError
 from src.automations_lib.providers.issabel_ami_provider import IssabelAmiProvider
 from src.bridge import BridgeNotifier
@@ -38,6 +39,7 @@ class ProactiveService:
         state_store: BotStateStore,
         issabel_provider: IssabelAmiProvider | None = None,
         bridge_notifier: BridgeNotifier | None = None,
+        http_pool: HttpClientPool | None = None,
     ) -> None:
         self._application = application
         self._settings = settings
@@ -60,6 +62,7 @@ class ProactiveService:
             timeout_seconds=settings.issabel_ami_timeout_seconds,
             use_tls=settings.issabel_ami_use_tls,
             peer_name_regex=settings.issabel_ami_peer_name_regex,
+            http_pool=http_pool,
         )
 
     async def start(self) -> None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
 import logging
 import json
 import math
@@ -560,6 +561,7 @@ class BotStateStore:
             ),
         }
 
+@lru_cache(maxsize=16)
 def _resolve_timezone(timezone_name: str):
     try:
         return ZoneInfo(timezone_name)
@@ -14,6 +14,7 @@ from src.automations_lib.orchestrator import StatusOrchestrator
 from src.automations_lib.providers.finance_provider import FinanceProvider
 from src.automations_lib.providers.health_provider import HealthProvider
 from src.automations_lib.providers.host_status_provider import HostStatusProvider
+from src.automations_lib.providers.http_pool import HttpClientPool
 from src.automations_lib.providers.news_provider import NewsProvider
 from src.automations_lib.providers.trends_provider import TrendsProvider
 from src.automations_lib.providers.voip_probe_provider import VoipProbeProvider
@@ -59,6 +60,16 @@ async def _post_shutdown(application: Application) -> None:
     discord_bridge = application.bot_data.get("discord_bridge_service")
     if discord_bridge is not None:
         await discord_bridge.stop()
+    http_pool = application.bot_data.get("http_pool")
+    if http_pool is not None:
+        try:
+            await http_pool.aclose()
+        except Exception:
+            logger.warning(
+                "failed to close shared http clients",
+                extra={"event": "http_pool_close_error"},
+                exc_info=True,
+            )
     state_store = application.bot_data.get("state_store")
     if state_store is not None:
         try:
@@ -86,22 +97,33 @@ def build_application(settings: Settings) -> Application:
     state_store = BotStateStore(settings.state_db_path)
     bridge_notifier = BridgeNotifier(settings)
     registry = AutomationRegistry()
+    http_pool = HttpClientPool()
     registry.register(StatusNewsAutomation(NewsProvider(settings.request_timeout_seconds)))
     registry.register(
-        StatusWeatherAutomation(WeatherProvider(settings.request_timeout_seconds))
+        StatusWeatherAutomation(
+            WeatherProvider(settings.request_timeout_seconds, http_pool=http_pool)
+        )
     )
     registry.register(StatusTrendsAutomation(TrendsProvider(settings.request_timeout_seconds)))
     registry.register(
-        StatusFinanceAutomation(FinanceProvider(settings.request_timeout_seconds))
+        StatusFinanceAutomation(
+            FinanceProvider(settings.request_timeout_seconds, http_pool=http_pool)
+        )
+    )
+    registry.register(
+        StatusHealthAutomation(
+            HealthProvider(settings.request_timeout_seconds, http_pool=http_pool)
+        )
     )
-    registry.register(StatusHealthAutomation(HealthProvider(settings.request_timeout_seconds)))
     registry.register(
         StatusHostAutomation(
             HostStatusProvider(
                 timeout_seconds=settings.request_timeout_seconds,
                 report_timezone=settings.host_report_timezone,
                 site_targets=settings.host_site_targets,
-            )
+                http_pool=http_pool,
+            ),
+            http_pool=http_pool,
         )
     )
 
@@ -127,6 +149,7 @@ def build_application(settings: Settings) -> Application:
         voip_provider=voip_provider,
         zabbix_provider=zabbix_provider,
         bridge_notifier=bridge_notifier,
+        http_pool=http_pool,
     )
     builder = (
         ApplicationBuilder()
@@ -142,6 +165,7 @@ def build_application(settings: Settings) -> Application:
         orchestrator=orchestrator,
         state_store=state_store,
         bridge_notifier=bridge_notifier,
+        http_pool=http_pool,
     )
     reminder_service = ReminderService(
         application=application,
@@ -166,6 +190,7 @@ def build_application(settings: Settings) -> Application:
     application.bot_data["voip_probe_service"] = voip_probe_service
     application.bot_data["discord_bridge_service"] = discord_bridge_service
     application.bot_data["state_store"] = state_store
+    application.bot_data["http_pool"] = http_pool
     if zabbix_provider is not None:
         application.bot_data["zabbix_provider"] = zabbix_provider
 
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
+import ssl
 from urllib.parse import parse_qs, urlparse
 
 import httpx
 import pytest
 
 from src.automations_lib.providers.ami_client import (
+    AmiClient,
     AmiError,
     AmiHttpRawmanClient,
     parse_rawman_messages,
 )
+from src.automations_lib.providers.http_pool import HttpClientPool
 
 
 def _make_async_client_factory(handler):
@@ -132,6 +137,119 @@ async def test_http_rawman_timeout(monkeypatch) -> None:
         await client.run_sip_peers()
 
 
+@pytest.mark.asyncio
+async def test_http_rawman_pooled_client_keeps_its_own_session_cookie() -> None:
+    sent_cookies: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        action = parse_qs(urlparse(str(request.url)).query).get("action", [""])[0].lower()
+        sent_cookies.append((action, request.headers.get("cookie", "")))
+        if action == "login":
+            return httpx.Response(
+                200,
+                headers={"set-cookie": "mansession_id=mine; Path=/"},
+                text="Response: Success\r\nMessage: Authentication accepted\r\n\r\n",
+            )
+        if action == "sippeers":
+            return httpx.Response(
+                200,
+                text=(
+                    "Response: Success\r\nMessage: Peer status list will follow\r\n\r\n"
+                    "Event: PeerlistComplete\r\nEventList: Complete\r\nListItems: 0\r\n\r\n"
+                ),
+            )
+        return httpx.Response(200, text="Response: Goodbye\r\nMessage: Thanks\r\n\r\n")
+
+    shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    # Left behind in the shared jar by another caller's login.
+    shared.cookies.set("mansession_id", "theirs", domain="pbx")
+
+    class FakePool:
+        def __init__(self) -> None:
+            self.leases: list[dict] = []
+
+        @asynccontextmanager
+        async def lease(self, **kwargs):
+            self.leases.append(kwargs)
+            yield shared
+
+    pool = FakePool()
+    client = AmiHttpRawmanClient(
+        rawman_url="http://pbx/asterisk/rawman",
+        username="ok",
+        secret="ok",
+        timeout_seconds=5,
+        http_pool=pool,
+    )
+
+    assert await client.run_sip_peers() == []
+    await shared.aclose()
+
+    assert len(pool.leases) == 1
+    assert sent_cookies == [
+        ("login", ""),
+        ("sippeers", "mansession_id=mine"),
+        ("logoff", "mansession_id=mine"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_http_rawman_pooled_sessions_keep_their_cookie_across_redirects(
+    monkeypatch,
+) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0)
+        if request.url.path == "/asterisk/rawman":
+            return httpx.Response(
+                302, headers={"location": f"http://pbx/ami/rawman?{request.url.query.decode()}"}
+            )
+        query = parse_qs(request.url.query.decode())
+        action = query.get("action", [""])[0].lower()
+        if action == "login":
+            return httpx.Response(
+                200,
+                headers={"set-cookie": f"mansession_id={query['username'][0]}; Path=/"},
+                text="Response: Success\r\nMessage: Authentication accepted\r\n\r\n",
+            )
+        if action == "sippeers":
+            owner = request.headers.get("cookie", "").removeprefix("mansession_id=")
+            return httpx.Response(
+                200,
+                text=(
+                    "Response: Success\r\nMessage: Peer status list will follow\r\n\r\n"
+                    f"Event: PeerEntry\r\nObjectName: {owner}\r\n\r\n"
+                ),
+            )
+        return httpx.Response(200, text="Response: Goodbye\r\nMessage: Thanks\r\n\r\n")
+
+    transport = httpx.MockTransport(handler)
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        "src.automations_lib.providers.http_pool.httpx.AsyncClient",
+        lambda **kwargs: real_async_client(transport=transport, **kwargs),
+    )
+    pool = HttpClientPool()
+
+    def rawman(username: str) -> AmiHttpRawmanClient:
+        return AmiHttpRawmanClient(
+            rawman_url="http://pbx/asterisk/rawman",
+            username=username,
+            secret="ok",
+            timeout_seconds=5,
+            http_pool=pool,
+        )
+
+    try:
+        alice, bob = await asyncio.gather(
+            rawman("alice").run_sip_peers(), rawman("bob").run_sip_peers()
+        )
+    finally:
+        await pool.aclose()
+
+    assert [entry["objectname"] for entry in alice] == ["alice"]
+    assert [entry["objectname"] for entry in bob] == ["bob"]
+
+
 def test_parse_rawman_messages_parses_multiple_blocks() -> None:
     text = (
         "Response: Success\r\nMessage: Authentication accepted\r\n\r\n"
@@ -144,3 +262,140 @@ def test_parse_rawman_messages_parses_multiple_blocks() -> None:
     assert messages[1]["event"] == "PeerEntry"
     assert messages[2]["objectname"] == "1102"
 
+
+def test_parse_rawman_messages_shares_normalized_keys() -> None:
+    first, second = parse_rawman_messages(
+        "Event: PeerEntry\r\nObjectName: 1101\r\n\r\n"
+        "EVENT: PeerEntry\r\nObjectName: 1102\r\n\r\n"
+    )
+
+    first_keys = list(first)
+    second_keys = list(second)
+    assert first_keys == ["event", "objectname"]
+    assert all(a is b for a, b in zip(first_keys, second_keys))
+
+
+def test_parse_rawman_messages_skips_blank_and_keyless_lines() -> None:
+    text = "\r\n\r\n  \r\nnoise\n: orphan\n Key : value \r\nEmpty:\r\n\r\n\r\n\r\nNext: 1"
+
+    assert parse_rawman_messages(text) == [{"key": "value", "empty": ""}, {"next": "1"}]
+
+
+async def _read_action(reader: asyncio.StreamReader) -> dict[str, str]:
+    fields: dict[str, str] = {}
+    while (line := (await reader.readline()).decode().rstrip("\r\n")):
+        key, _, value = line.partition(":")
+        fields[key.strip().lower()] = value.strip()
+    return fields
+
+
+def _scripted_ami_server(
+    peer_count: int, *, answer_login: bool = True, newline: str = "\r\n"
+):
+    seen_actions: list[str] = []
+    finished = asyncio.Event()
+
+    def send(writer: asyncio.StreamWriter, text: str) -> None:
+        writer.write(text.replace("\r\n", newline).encode())
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        send(writer, "Asterisk Call Manager/5.0.1\r\n")
+        login = await _read_action(reader)
+        seen_actions.append(login.get("action", ""))
+        if not answer_login:
+            await reader.read()
+            writer.close()
+            return
+        send(
+            writer,
+            f"Response: Success\r\nActionID: {login['actionid']}\r\n"
+            "Message: Authentication accepted\r\n\r\n",
+        )
+        sippeers = await _read_action(reader)
+        seen_actions.append(sippeers.get("action", ""))
+        frames = [
+            f"Response: Success\r\nActionID: {sippeers['actionid']}\r\n"
+            "Message: Peer status list will follow\r\n\r\n"
+        ]
+        frames.extend(
+            f"Event: PeerEntry\r\nObjectName: {1100 + idx}\r\n"
+            f"IPaddress: 10.0.0.{idx}\r\nStatus: OK (5 ms)\r\n\r\n"
+            for idx in range(peer_count)
+        )
+        frames.append("Event: PeerlistComplete\r\nEventList: Complete\r\n\r\n")
+        send(writer, "".join(frames))
+        seen_actions.append((await _read_action(reader)).get("action", ""))
+        writer.close()
+        finished.set()
+
+    return handle, seen_actions, finished
+
+
+@pytest.mark.asyncio
+async def test_tcp_ami_client_lists_sip_peers() -> None:
+    handle, seen_actions, finished = _scripted_ami_server(peer_count=300)
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = AmiClient(host="127.0.0.1", port=port, username="u", secret="s", timeout_seconds=2)
+    try:
+        entries = await client.run_sip_peers()
+        await asyncio.wait_for(finished.wait(), timeout=2)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert len(entries) == 300
+    assert [entry["objectname"] for entry in entries[:3]] == ["1100", "1101", "1102"]
+    assert entries[0]["status"] == "OK (5 ms)"
+    assert seen_actions == ["Login", "SIPpeers", "Logoff"]
+
+
+@pytest.mark.asyncio
+async def test_tcp_ami_client_accepts_lf_only_frames() -> None:
+    handle, seen_actions, finished = _scripted_ami_server(peer_count=2, newline="\n")
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = AmiClient(host="127.0.0.1", port=port, username="u", secret="s", timeout_seconds=2)
+    try:
+        entries = await client.run_sip_peers()
+        await asyncio.wait_for(finished.wait(), timeout=2)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert [entry["objectname"] for entry in entries] == ["1100", "1101"]
+    assert seen_actions == ["Login", "SIPpeers", "Logoff"]
+
+
+@pytest.mark.asyncio
+async def test_tcp_ami_client_times_out_when_server_goes_idle() -> None:
+    handle, _, _ = _scripted_ami_server(peer_count=0, answer_login=False)
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = AmiClient(host="127.0.0.1", port=port, username="u", secret="s", timeout_seconds=1)
+    try:
+        with pytest.raises(AmiError, match="timeout"):
+            await client.run_sip_peers()
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_tcp_ami_client_reuses_tls_context(monkeypatch) -> None:
+    contexts = []
+
+    async def fake_open_connection(host, port, *, ssl=None, limit=None):
+        contexts.append(ssl)
+        raise ConnectionRefusedError
+
+    monkeypatch.setattr(asyncio, "open_connection", fake_open_connection)
+    client = AmiClient(
+        host="127.0.0.1", port=5039, username="u", secret="s", timeout_seconds=1, use_tls=True
+    )
+    for _ in range(2):
+        with pytest.raises(ConnectionRefusedError):
+            await client.run_sip_peers()
+
+    assert contexts[0] is contexts[1]
+    assert contexts[0].verify_mode == ssl.CERT_NONE
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from src.automations_lib import bounded_cache
+from src.automations_lib.bounded_cache import BoundedCache
+
+
+def test_bounded_cache_evicts_least_recently_used() -> None:
+    cache: BoundedCache[str, int] = BoundedCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_bounded_cache_expires_entries_after_ttl(monkeypatch) -> None:
+    clock = {"now": 100.0}
+    monkeypatch.setattr(bounded_cache, "monotonic", lambda: clock["now"])
+    cache: BoundedCache[str, str] = BoundedCache(maxsize=4, ttl_seconds=10)
+    cache["k"] = "v"
+
+    clock["now"] += 5
+    assert cache.get("k") == "v"
+
+    clock["now"] += 6
+    assert cache.get("k") is None
+    assert len(cache) == 0
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 
@@ -72,6 +74,13 @@ async def test_lookup_cep_invalid() -> None:
         await provider.lookup("abc")
 
 
+def test_normalize_cep_strips_any_non_digit() -> None:
+    provider = CepProvider(timeout_seconds=5, url_template="https://viacep.com.br/ws/{cep}/json/")
+
+    assert provider._normalize_cep(" 01001\u2013000 ") == "01001000"
+    assert provider._normalize_cep("01.001-000") == "01001000"
+
+
 @pytest.mark.asyncio
 async def test_lookup_cep_not_found(monkeypatch) -> None:
     url = "https://viacep.com.br/ws/99999999/json/"
@@ -82,3 +91,57 @@ async def test_lookup_cep_not_found(monkeypatch) -> None:
     provider = CepProvider(timeout_seconds=5, url_template="https://viacep.com.br/ws/{cep}/json/")
     with pytest.raises(ValueError):
         await provider.lookup("99999999")
+
+
+@pytest.mark.asyncio
+async def test_lookup_cep_leases_client_from_shared_pool() -> None:
+    url = "https://viacep.com.br/ws/01001000/json/"
+    leases: list[dict] = []
+
+    class FakePool:
+        def lease(self, **kwargs):
+            leases.append(kwargs)
+            return FakeAsyncClient({url: FakeResponse({"cep": "01001-000"})})
+
+    provider = CepProvider(
+        timeout_seconds=5,
+        url_template="https://viacep.com.br/ws/{cep}/json/",
+        http_pool=FakePool(),
+    )
+    info = await provider.lookup("01001000")
+
+    assert info.cep == "01001-000"
+    assert leases == [{"timeout": 5, "follow_redirects": True}]
+
+
+@pytest.mark.asyncio
+async def test_lookup_cep_caches_found_addresses_only(monkeypatch) -> None:
+    found = "https://viacep.com.br/ws/01001000/json/"
+    missing = "https://viacep.com.br/ws/99999999/json/"
+    requested: list[str] = []
+
+    class CountingClient(FakeAsyncClient):
+        async def get(self, url: str, **kwargs):
+            requested.append(url)
+            return await super().get(url, **kwargs)
+
+    responses = {
+        found: FakeResponse({"cep": "01001-000", "localidade": "Sao Paulo"}),
+        missing: FakeResponse({"erro": True}),
+    }
+    monkeypatch.setattr(
+        "src.automations_lib.providers.cep_provider.httpx.AsyncClient",
+        lambda **kwargs: CountingClient(responses, **kwargs),
+    )
+    provider = CepProvider(timeout_seconds=5, url_template="https://viacep.com.br/ws/{cep}/json/")
+
+    first, second = await asyncio.gather(
+        provider.lookup("01001-000"), provider.lookup("01001000")
+    )
+    third = await provider.lookup("01001 000")
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await provider.lookup("99999999")
+
+    assert first is second is third
+    assert requested == [found, missing, missing]
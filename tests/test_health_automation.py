@@ -75,3 +75,30 @@ async def test_health_automation_formats_report() -> None:
     assert "trace-health" in result.message
     assert "Falhas por fonte" in result.message
     assert "timeout" in result.message
+
+
+class CountingProvider(FakeProvider):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def fetch_health(self, probes):
+        self.calls += 1
+        return await super().fetch_health(probes)
+
+
+@pytest.mark.asyncio
+async def test_health_automation_reuses_recent_probe_results() -> None:
+    provider = CountingProvider()
+    automation = StatusHealthAutomation(provider=provider, cache_ttl_seconds=60)
+
+    await automation.run(build_context())
+    result = await automation.run(build_context())
+
+    assert provider.calls == 1
+    assert "Fontes OK: <b>1/2</b>" in result.message
+
+    expired = StatusHealthAutomation(provider=provider, cache_ttl_seconds=0)
+    await expired.run(build_context())
+    await expired.run(build_context())
+
+    assert provider.calls == 3
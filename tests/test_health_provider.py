@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 
@@ -52,3 +54,29 @@ async def test_fetch_health_reports_ok_and_failure(monkeypatch) -> None:
     assert report[1].status_code is None
     assert report[1].error is not None
 
+
+@pytest.mark.asyncio
+async def test_fetch_health_bounds_concurrent_probes(monkeypatch) -> None:
+    in_flight = 0
+    peak = 0
+
+    class SlowClient(FakeAsyncClient):
+        async def get(self, url: str, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return FakeResponse(200)
+
+    monkeypatch.setattr(
+        "src.automations_lib.providers.health_provider.httpx.AsyncClient",
+        lambda **kwargs: SlowClient({}, **kwargs),
+    )
+    provider = HealthProvider(timeout_seconds=5, max_concurrency=2)
+    probes = [(f"S{idx}", f"https://s{idx}.example") for idx in range(6)]
+    report = await provider.fetch_health(probes)
+
+    assert [item.source for item in report] == [source for source, _ in probes]
+    assert all(item.ok for item in report)
+    assert peak == 2
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import pytest
+
+from src.automations_lib.providers.http_pool import HttpClientPool
+
+
+@pytest.mark.asyncio
+async def test_http_pool_reuses_client_per_option_set_and_closes_all() -> None:
+    pool = HttpClientPool()
+
+    async with pool.lease(timeout=5, follow_redirects=True) as first:
+        pass
+    async with pool.lease(timeout=5, follow_redirects=True) as again:
+        pass
+    async with pool.lease(timeout=5, follow_redirects=True, verify=False) as insecure:
+        pass
+
+    assert first is again
+    assert first.is_closed is False
+    assert insecure is not first
+
+    await pool.aclose()
+
+    assert first.is_closed is True
+    assert insecure.is_closed is True
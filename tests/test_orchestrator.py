@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import logging
 
 import pytest
 
@@ -86,3 +88,65 @@ async def test_orchestrator_continues_after_failure() -> None:
     assert "Falha ao executar automacao" in results[0].message
     assert results[1].ok is True
     assert results[1].message == "ok"
+
+
+@dataclass
+class SlowAutomation:
+    name: str
+    delay: float
+    trigger: str = "status"
+
+    async def run(self, context: AutomationContext) -> AutomationResult:
+        del context
+        await asyncio.sleep(self.delay)
+        return AutomationResult(
+            title=self.name,
+            message=self.name,
+            source_label=self.name,
+            generated_at=datetime.now(timezone.utc),
+            ok=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_runs_automations_concurrently_in_registry_order() -> None:
+    registry = AutomationRegistry()
+    registry.register(SlowAutomation(name="slow", delay=0.2))
+    registry.register(SlowAutomation(name="fast", delay=0.1))
+    registry.register(SlowAutomation(name="stuck", delay=5))
+    orchestrator = StatusOrchestrator(registry, timeout_seconds=0.3)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await orchestrator.run_trigger(
+        "status",
+        AutomationContext(settings=settings()),
+    )
+
+    assert loop.time() - started < 0.6
+    assert [result.title for result in results] == ["slow", "fast", "stuck"]
+    assert [result.ok for result in results] == [True, True, False]
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_skips_info_logs_when_level_is_warning(caplog) -> None:
+    registry = AutomationRegistry()
+    registry.register(SuccessAutomation())
+    orchestrator = StatusOrchestrator(registry, timeout_seconds=5)
+    context = AutomationContext(settings=settings())
+
+    with caplog.at_level(logging.WARNING, logger="src.automations_lib.orchestrator"):
+        await orchestrator.run_trigger("status", context)
+    assert caplog.records == []
+
+    with caplog.at_level(logging.INFO, logger="src.automations_lib.orchestrator"):
+        await orchestrator.run_trigger("status", context)
+    assert [record.event for record in caplog.records] == [
+        "trigger_start",
+        "automation_ok",
+        "trigger_end",
+    ]
+    ok_record = caplog.records[1]
+    assert isinstance(ok_record.latency_ms, int)
+    assert isinstance(ok_record.latency_us, int)
+    assert ok_record.latency_ms == ok_record.latency_us // 1_000
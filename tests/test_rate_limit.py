@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from src.automations_lib.providers import rate_limit
+from src.automations_lib.providers.http_pool import DEFAULT_HOST_RATE_LIMITS
+from src.automations_lib.providers.rate_limit import AsyncRateLimiter, HostRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_once_bucket_is_full(monkeypatch) -> None:
+    clock = {"now": 100.0}
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        clock["now"] += delay
+
+    monkeypatch.setattr(rate_limit, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+    limiter = AsyncRateLimiter(2, 1.0)
+
+    await limiter.acquire()
+    await limiter.acquire()
+    assert sleeps == []
+
+    await limiter.acquire()
+    assert sleeps == [pytest.approx(0.5)]
+
+
+def test_host_rate_limiter_matches_parent_domains() -> None:
+    limiter = HostRateLimiter({"finance.yahoo.com": (60, 60)})
+
+    assert limiter.limiter_for("query1.finance.yahoo.com") is limiter.limiter_for(
+        "finance.yahoo.com"
+    )
+    assert limiter.limiter_for("notfinance.yahoo.com") is None
+    assert limiter.limiter_for("example.com") is None
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://statusblog.locaweb.com.br/api/v2/summary.json",
+        "https://metastatus.com/data/orgs.json",
+        "https://status.umbrella.com/api/v2/incidents.json",
+        "https://statuspage.hostinger.com/api/v2/components.json",
+    ],
+)
+def test_default_host_limits_cover_status_pages(url: str) -> None:
+    limiter = HostRateLimiter(DEFAULT_HOST_RATE_LIMITS)
+
+    assert limiter.limiter_for(httpx.URL(url).host) is not None
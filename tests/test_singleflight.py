@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.automations_lib.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_concurrent_calls_and_releases_key() -> None:
+    calls = 0
+    release = asyncio.Event()
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    flight: SingleFlight[int] = SingleFlight()
+    first = asyncio.create_task(flight.run("k", work))
+    second = asyncio.create_task(flight.run("k", work))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(first, second) == [1, 1]
+    await asyncio.sleep(0)
+    assert await flight.run("k", work) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelled_caller_does_not_cancel_shared_work() -> None:
+    release = asyncio.Event()
+
+    async def work() -> str:
+        await release.wait()
+        return "done"
+
+    flight: SingleFlight[str] = SingleFlight()
+    impatient = asyncio.create_task(flight.run("k", work))
+    patient = asyncio.create_task(flight.run("k", work))
+    await asyncio.sleep(0)
+    impatient.cancel()
+    release.set()
+
+    assert await patient == "done"
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+import httpx
 import pytest
 
-from src.automations_lib.automations.status_host import StatusHostAutomation
+from src.automations_lib.automations.status_host import (
+    StatusHostAutomation,
+    _datetime_formatter,
+    _format_datetime,
+    _prepare_body,
+    _truncate_chars,
+    _truncate_lines,
+)
 from src.automations_lib.models import AutomationContext
 from src.automations_lib.providers.host_status_provider import (
     HostingerReport,
@@ -34,6 +43,15 @@ class FakeTranslator:
         return FakeTranslationResult(text=f"PT::{text}")
 
 
+class RecordingTranslator(FakeTranslator):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def translate(self, text: str, dest: str = "pt") -> FakeTranslationResult:
+        self.calls.append(text)
+        return super().translate(text, dest)
+
+
 class FailingTranslator:
     def translate(self, text: str, dest: str = "pt"):
         del text, dest
@@ -477,3 +495,367 @@ async def test_status_host_cisco_shows_only_first_update_per_incident() -> None:
     assert result.ok is True
     assert "Resolvido |" in result.message
     assert "Identificado |" not in result.message
+
+
+@pytest.mark.asyncio
+async def test_status_host_does_not_wait_on_label_warmup_when_umbrella_is_healthy() -> None:
+    class HangingTranslator:
+        async def translate(self, text: str, dest: str = "pt") -> FakeTranslationResult:
+            del dest
+            await asyncio.sleep(5)
+            return FakeTranslationResult(text=f"PT::{text}")
+
+    automation = StatusHostAutomation(
+        FakeProvider(
+            snapshot=HostSnapshot(
+                locaweb=LocawebReport(
+                    component_statuses={"Hospedagem": "operational"},
+                    all_operational=True,
+                    incidents_today=[],
+                    error=None,
+                ),
+                meta=MetaReport(
+                    orgs=[],
+                    whatsapp_availability=None,
+                    whatsapp_latency_p90_ms=None,
+                    whatsapp_latency_p99_ms=None,
+                    incidents_today=[],
+                    error=None,
+                ),
+                umbrella=UmbrellaReport(
+                    component_statuses={"Umbrella Global": "operational"},
+                    component_statuses_human={"Umbrella Global": "Operational"},
+                    all_operational=True,
+                    incidents_active_or_today=[],
+                    error=None,
+                ),
+                hostinger=HostingerReport(
+                    overall_ok=True,
+                    vps_components_non_operational={},
+                    incidents_active_recent=[],
+                    upcoming_maintenances=[],
+                    error=None,
+                ),
+                websites=WebsiteChecksReport(checks=[]),
+            )
+        ),
+        translator=HangingTranslator(),
+    )
+
+    result = await asyncio.wait_for(automation.run(build_context()), timeout=1)
+
+    assert result.ok is True
+    assert "Cisco Umbrella" not in result.message
+
+
+def test_status_host_format_datetime_matches_astimezone_for_fixed_offsets() -> None:
+    moment = datetime(2026, 2, 13, 4, 0, tzinfo=timezone.utc)
+    fixed = timezone(timedelta(hours=-3))
+
+    assert _format_datetime(moment, fixed) == "13/02/2026 01:00"
+    assert _format_datetime(moment, timezone.utc) == "13/02/2026 04:00"
+    # Equal aware datetimes share an lru_cache entry in _format_datetime, so the
+    # already-local branch is only reachable through the formatter itself.
+    assert _datetime_formatter(fixed)(moment.astimezone(fixed)) == "13/02/2026 01:00"
+    assert _format_datetime(None, fixed) == "horario indisponivel"
+
+
+@pytest.mark.asyncio
+async def test_status_host_umbrella_translates_distinct_strings_concurrently() -> None:
+    class SlowTranslator:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+            self.active = 0
+            self.peak = 0
+
+        async def translate(self, text: str, dest: str = "pt") -> FakeTranslationResult:
+            del dest
+            self.calls.append(text)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0)
+            self.active -= 1
+            return FakeTranslationResult(text=f"PT::{text}")
+
+    translator = SlowTranslator()
+    automation = StatusHostAutomation(FakeProvider(snapshot=None), translator=translator)
+    report = UmbrellaReport(
+        component_statuses={"Umbrella Global": "major_outage"},
+        component_statuses_human={"Umbrella Global": "Major Outage"},
+        all_operational=False,
+        incidents_active_or_today=[
+            HostIncident(
+                source_id="umb-1",
+                title="DNS delays",
+                status="Investigating",
+                started_at=None,
+                updates=[
+                    HostIncidentUpdate(
+                        status="Investigating",
+                        body="We are looking into it.",
+                        display_at=None,
+                    )
+                ],
+            )
+        ],
+        error=None,
+    )
+
+    lines = await automation._format_umbrella(report, timezone.utc)  # noqa: SLF001
+
+    assert "- PT::DNS delays" in lines
+    assert translator.peak > 1
+    assert len(translator.calls) == len(set(translator.calls))
+
+
+@pytest.mark.asyncio
+async def test_status_host_keeps_static_label_translations_across_runs() -> None:
+    translator = RecordingTranslator()
+    automation = StatusHostAutomation(FakeProvider(snapshot=None), translator=translator)
+    report = UmbrellaReport(
+        component_statuses={"Umbrella Global": "major_outage"},
+        component_statuses_human={"Umbrella Global": "Major Outage"},
+        all_operational=False,
+        incidents_active_or_today=[],
+        error=None,
+    )
+
+    await automation._format_umbrella(report, timezone.utc)  # noqa: SLF001
+    automation._translation_cache.clear()  # noqa: SLF001 - e.g. after the TTL expires
+    translator.calls.clear()
+    await automation._format_umbrella(report, timezone.utc)  # noqa: SLF001
+
+    assert "Saude: ALERTA" not in translator.calls
+    assert "Umbrella Global" in translator.calls
+
+
+def test_status_host_truncate_helpers_trim_lines_like_splitlines() -> None:
+    body = "  first line \r\n\n\tsecond\x0bthird  \n   \nfourth\n"
+
+    assert _truncate_lines(body, max_lines=3) == ["first line", "second", "third ..."]
+    assert _truncate_lines(body, max_lines=4) == ["first line", "second", "third", "fourth"]
+    assert _truncate_lines(" \n\t\n", max_lines=3) == ["Sem detalhes."]
+    assert _truncate_chars(body, max_chars=200) == "first line second third fourth"
+    assert _truncate_chars(body, max_chars=11) == "first line"
+    assert _prepare_body(body, max_chars=None, max_lines=3) == _truncate_lines(body, 3)
+    assert _prepare_body(body, max_chars=14, max_lines=3) == ["first line sec"]
+    assert _prepare_body(" \n ", max_chars=14, max_lines=3) == ["Sem detalhes."]
+
+
+@pytest.mark.asyncio
+async def test_status_host_does_not_retranslate_its_own_output() -> None:
+    translator = RecordingTranslator()
+    automation = StatusHostAutomation(FakeProvider(snapshot=None), translator=translator)
+
+    translated = await automation._translate_text("Degraded", critical=True)  # noqa: SLF001
+    again = await automation._translate_text(translated, critical=True)  # noqa: SLF001
+
+    assert translated == again == "PT::Degraded"
+    assert translator.calls == ["Degraded"]
+
+
+@pytest.mark.asyncio
+async def test_status_host_skips_translator_for_letterless_text() -> None:
+    translator = RecordingTranslator()
+    automation = StatusHostAutomation(FakeProvider(snapshot=None), translator=translator)
+
+    translated = await automation._translate_text(" 12:30 - 99.9% ", critical=True)  # noqa: SLF001
+
+    assert translated == "12:30 - 99.9%"
+    assert translator.calls == []
+
+
+def test_status_host_pt_fallback_prefers_full_sentences_over_fragments() -> None:
+    body = (
+        "We are very close to moving into a monitoring state and expect normal "
+        "policy update functionality to be restored soon. Policy generation is "
+        "functioning as expected"
+    )
+
+    assert StatusHostAutomation._apply_pt_fallback(body) == (  # noqa: SLF001
+        "Estamos muito perto de entrar em monitoramento e esperamos restaurar em "
+        "breve o funcionamento normal das atualizacoes de politica. A geracao de "
+        "politicas esta funcionando como esperado"
+    )
+
+
+@pytest.mark.asyncio
+async def test_status_host_serves_status_vocabulary_without_translator() -> None:
+    automation = StatusHostAutomation(
+        FakeProvider(snapshot=None), translator=FailingTranslator()
+    )
+
+    assert await automation._translate_text("Resolved", critical=True) == "Resolvido"  # noqa: SLF001
+    assert await automation._translate_text("major_outage") == "Indisponibilidade critica"  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_status_host_retries_failed_translations_after_short_ttl() -> None:
+    automation = StatusHostAutomation(
+        FakeProvider(snapshot=None),
+        translator=FailingTranslator(),
+        translation_retry_seconds=0,
+    )
+
+    assert await automation._translate_text("DNS delays", critical=True) == "DNS delays"  # noqa: SLF001
+    assert (True, "DNS delays") not in automation._translation_cache  # noqa: SLF001
+
+    assert await automation._translate_text("Saude: ALERTA", critical=True) == "Saude: ALERTA"  # noqa: SLF001
+    assert (True, "Saude: ALERTA") not in automation._static_translation_cache  # noqa: SLF001
+
+    # Same run: an echoed failure must not count as already translated.
+    automation._translator = FakeTranslator()  # noqa: SLF001 - translator recovers
+    assert await automation._translate_text("DNS delays", critical=True) == "PT::DNS delays"  # noqa: SLF001
+    assert automation._translation_cache.get((True, "DNS delays")) == "PT::DNS delays"  # noqa: SLF001
+    assert await automation._translate_text("Saude: ALERTA", critical=True) == "PT::Saude: ALERTA"  # noqa: SLF001
+    assert automation._static_translation_cache[(True, "Saude: ALERTA")] == "PT::Saude: ALERTA"  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_status_host_coalesces_concurrent_translations_of_same_text() -> None:
+    class SlowTranslator:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def translate(self, text: str, dest: str = "pt") -> FakeTranslationResult:
+            del dest
+            self.calls += 1
+            await asyncio.sleep(0)
+            return FakeTranslationResult(text=f"PT::{text}")
+
+    translator = SlowTranslator()
+    automation = StatusHostAutomation(FakeProvider(snapshot=None), translator=translator)
+
+    results = await asyncio.gather(
+        *(automation._translate_text("Degraded", critical=True) for _ in range(3))  # noqa: SLF001
+    )
+
+    assert results == ["PT::Degraded"] * 3
+    assert translator.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_status_host_translates_static_labels_while_fetching_snapshot() -> None:
+    translator = RecordingTranslator()
+    calls_during_fetch: list[str] = []
+
+    class SlowProvider:
+        async def fetch_snapshot(self, **kwargs) -> HostSnapshot:
+            del kwargs
+            await asyncio.sleep(0.05)
+            calls_during_fetch.extend(translator.calls)
+            raise RuntimeError("stop after fetch")
+
+    automation = StatusHostAutomation(SlowProvider(), translator=translator)
+
+    with pytest.raises(RuntimeError):
+        await automation.run(build_context())
+
+    assert "Incidentes ativos/hoje" in calls_during_fetch
+    assert "Saude: ALERTA" in calls_during_fetch
+
+
+def test_status_host_looks_untranslated_ignores_case_and_punctuation() -> None:
+    body = "We are investigating reports of degraded performance. " * 20
+    looks_untranslated = StatusHostAutomation._looks_untranslated  # noqa: SLF001
+
+    assert looks_untranslated(body, body.upper().replace(". ", "! "))
+    assert looks_untranslated("Resolved", " resolved. ")
+    assert not looks_untranslated(body, "Estamos investigando relatos. " * 40)
+    assert not looks_untranslated(body, body + "extra")
+
+
+@pytest.mark.asyncio
+async def test_status_host_batches_http_translations_without_translator() -> None:
+    requests: list[str] = []
+
+    class FakeResponse:
+        def __init__(self, text: str) -> None:
+            self._text = text
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self):
+            return [[[f"PT::{line}\n"] for line in self._text.split("\n")]]
+
+    class FakeClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info) -> None:
+            return None
+
+        async def get(self, url: str, params: dict[str, str]) -> FakeResponse:
+            del url
+            requests.append(params["q"])
+            return FakeResponse(params["q"])
+
+    automation = StatusHostAutomation(FakeProvider(snapshot=None))
+    automation._get_translator = lambda: None  # noqa: SLF001
+    automation._http_client = lambda **kwargs: FakeClient()  # noqa: SLF001
+
+    await automation._prime_translations(["DNS delays", "Umbrella Global", "Investigating"])  # noqa: SLF001
+
+    assert len(requests) == 1
+    assert await automation._translate_text("DNS delays", critical=True) == "PT::DNS delays"  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_status_host_falls_back_to_single_requests_when_batch_fails() -> None:
+    requests: list[str] = []
+
+    class FakeResponse:
+        def __init__(self, text: str) -> None:
+            self._text = text
+
+        def raise_for_status(self) -> None:
+            if "\n" in self._text:
+                raise httpx.HTTPError("rate limited")
+
+        def json(self):
+            return [[[f"PT::{self._text}"]]]
+
+    class FakeClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info) -> None:
+            return None
+
+        async def get(self, url: str, params: dict[str, str]) -> FakeResponse:
+            del url
+            requests.append(params["q"])
+            return FakeResponse(params["q"])
+
+    automation = StatusHostAutomation(FakeProvider(snapshot=None))
+    automation._get_translator = lambda: None  # noqa: SLF001
+    automation._http_client = lambda **kwargs: FakeClient()  # noqa: SLF001
+
+    await automation._prime_translations(["DNS delays", "Umbrella Global"])  # noqa: SLF001
+
+    assert len(requests) == 3
+    assert sorted(requests[1:]) == ["DNS delays", "Umbrella Global"]
+    assert await automation._translate_text("DNS delays", critical=True) == "PT::DNS delays"  # noqa: SLF001
+    assert await automation._translate_text("Umbrella Global", critical=True) == "PT::Umbrella Global"  # noqa: SLF001
+
+
+@pytest.mark.asyncio
+async def test_status_host_sends_critical_googletrans_strings_straight_to_http() -> None:
+    class GoogletransTranslator(RecordingTranslator):
+        __module__ = "googletrans.client"
+
+    http_calls: list[str] = []
+
+    async def fake_http(text: str) -> str:
+        http_calls.append(text)
+        return f"HTTP::{text}"
+
+    translator = GoogletransTranslator()
+    automation = StatusHostAutomation(FakeProvider(snapshot=None), translator=translator)
+    automation._translate_text_via_google_http = fake_http  # noqa: SLF001
+
+    assert await automation._translate_text("DNS delays", critical=True) == "HTTP::DNS delays"  # noqa: SLF001
+    assert await automation._translate_text("DNS delays") == "PT::DNS delays"  # noqa: SLF001
+    assert http_calls == ["DNS delays"]
+    assert translator.calls == ["DNS delays"]
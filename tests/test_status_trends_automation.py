@@ -78,3 +78,24 @@ async def test_trends_automation_formats_ranked_list() -> None:
     assert "1. Tema 1" in result.message
     assert "3. Tema 3" in result.message
     assert result.source_label == "Trends24"
+
+
+@pytest.mark.asyncio
+async def test_trends_automation_escapes_source_and_topics() -> None:
+    automation = StatusTrendsAutomation(
+        FakeProvider(
+            snapshot=TrendsSnapshot(
+                source_name="Trends <24>",
+                source_url='https://trends24.in/brazil/?a=1&b="2"',
+                trends=["P&G", "<script>"],
+            )
+        )
+    )
+
+    result = await automation.run(build_context())
+
+    assert 'href="https://trends24.in/brazil/?a=1&amp;b=&quot;2&quot;">Trends &lt;24&gt;</a>' in (
+        result.message
+    )
+    assert "1. P&amp;G" in result.message
+    assert "2. &lt;script&gt;" in result.message
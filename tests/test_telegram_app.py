@@ -180,8 +180,9 @@ class FakeZabbixProvider:
 
 
 class FakeAutomation:
-    def __init__(self, provider: object) -> None:
+    def __init__(self, provider: object, **kwargs) -> None:
         self.provider = provider
+        self.kwargs = kwargs
 
 
 @dataclass
@@ -396,6 +397,22 @@ async def test_post_shutdown_stops_services_and_closes_state_store() -> None:
     assert state_store.closed is True
 
 
+@pytest.mark.asyncio
+async def test_post_shutdown_closes_shared_http_pool() -> None:
+    class FakeHttpPool:
+        closed = False
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    http_pool = FakeHttpPool()
+    application = LifecycleApplication(bot_data={"http_pool": http_pool})
+
+    await telegram_app._post_shutdown(application)
+
+    assert http_pool.closed is True
+
+
 @pytest.mark.asyncio
 async def test_post_shutdown_tolerates_missing_services() -> None:
     application = LifecycleApplication(bot_data={})
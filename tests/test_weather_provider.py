@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 
 from src.automations_lib.providers.weather_provider import WeatherProvider
+from src.automations_lib.timezones import resolve_timezone
 
 
 def test_build_snapshot_temperatures_and_rain_window() -> None:
@@ -32,15 +33,19 @@ def test_current_local_datetime_fallback_for_sao_paulo(monkeypatch) -> None:
         raise FakeZoneInfoNotFoundError("missing tz")
 
     monkeypatch.setattr(
-        "src.automations_lib.providers.weather_provider.ZoneInfoNotFoundError",
+        "src.automations_lib.timezones.ZoneInfoNotFoundError",
         FakeZoneInfoNotFoundError,
     )
     monkeypatch.setattr(
-        "src.automations_lib.providers.weather_provider.ZoneInfo",
+        "src.automations_lib.timezones.ZoneInfo",
         raise_zoneinfo_not_found,
     )
+    resolve_timezone.cache_clear()
 
-    now_local = WeatherProvider.current_local_datetime("America/Sao_Paulo")
+    try:
+        now_local = WeatherProvider.current_local_datetime("America/Sao_Paulo")
+    finally:
+        resolve_timezone.cache_clear()
 
     assert now_local.tzinfo is not None
     assert now_local.utcoffset() == timedelta(hours=-3)